@@ -7,7 +7,20 @@ import operator
 import os
 
 
+# Built once so every request sends a byte-identical prompt prefix
+SYSTEM_MESSAGE = SystemMessage(content="""You are a helpful AI assistant for a creator's course or digital product.
+            Your role is to answer student questions based on the course content provided.
+
+            Guidelines:
+            - Only answer based on the context provided
+            - If the context doesn't contain relevant information, say you don't know
+            - Cite specific sources when possible (e.g., "In Module 3...")
+            - Be friendly and helpful in the creator's voice
+            - If the question requires human intervention, flag it for escalation""")
+
+
 class AgentState(TypedDict):
+    messages: list
     context: list[str]
     query: str
     creator_id: str
@@ -66,16 +79,12 @@ class SupportAgent:
         context_str = "\n\n".join(state["context"])
         query = state["query"]
 
+        # Stable prefix first (system prompt, then prior turns in order) so the
+        # provider's prompt cache can reuse it; per-turn retrieved context and
+        # the question go last
         messages = [
-            SystemMessage(content="""You are a helpful AI assistant for a creator's course or digital product.
-            Your role is to answer student questions based on the course content provided.
-
-            Guidelines:
-            - Only answer based on the context provided
-            - If the context doesn't contain relevant information, say you don't know
-            - Cite specific sources when possible (e.g., "In Module 3...")
-            - Be friendly and helpful in the creator's voice
-            - If the question requires human intervention, flag it for escalation"""),
+            SYSTEM_MESSAGE,
+            *state.get("messages", []),
             HumanMessage(content=f"""Context from course materials:
             {context_str}
 
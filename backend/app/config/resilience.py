@@ -4,29 +4,37 @@ Defines circuit breaker configurations for different external services.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
-    """Configuration for a circuit breaker."""
+    """Configuration for a circuit breaker. Immutable so instances can be shared."""
     failure_threshold: int = 5      # Failures before opening
     success_threshold: int = 3      # Successes to close from half-open
     timeout_seconds: float = 30.0   # Time before trying half-open
 
 
 # Per-service configurations
+OPENAI_CONFIG = CircuitBreakerConfig(failure_threshold=3, timeout_seconds=60)
+PINECONE_CONFIG = CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30)
+SUPABASE_CONFIG = CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30)
+DEFAULT_CONFIG = CircuitBreakerConfig()
+
 SERVICE_CONFIGS = {
-    "openai": CircuitBreakerConfig(failure_threshold=3, timeout_seconds=60),
-    "pinecone": CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30),
-    "supabase": CircuitBreakerConfig(failure_threshold=5, timeout_seconds=30),
-    "default": CircuitBreakerConfig(),
+    "openai": OPENAI_CONFIG,
+    "pinecone": PINECONE_CONFIG,
+    "supabase": SUPABASE_CONFIG,
+    "default": DEFAULT_CONFIG,
 }
 
 
+@lru_cache(maxsize=32)
 def get_config(service: str) -> CircuitBreakerConfig:
     """
     Get the circuit breaker configuration for a given service.
+    Results are memoized; the returned instance is the shared module constant.
 
     Args:
         service: The name of the external service
@@ -34,11 +42,15 @@ def get_config(service: str) -> CircuitBreakerConfig:
     Returns:
         CircuitBreakerConfig for the service
     """
-    return SERVICE_CONFIGS.get(service, SERVICE_CONFIGS["default"])
+    return SERVICE_CONFIGS.get(service, DEFAULT_CONFIG)
 
 
 __all__ = [
     "CircuitBreakerConfig",
+    "OPENAI_CONFIG",
+    "PINECONE_CONFIG",
+    "SUPABASE_CONFIG",
+    "DEFAULT_CONFIG",
     "SERVICE_CONFIGS",
     "get_config",
 ]
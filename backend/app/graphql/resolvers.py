@@ -344,8 +344,8 @@ class GraphQLResolver:
             GraphQLError: If database operation fails.
         """
         self._sync_db()
-        if self._db and self._db._raise_exception:
-            raise GraphQLError(str(self._db._raise_exception))
+        if self._db and self._db.raise_exception:
+            raise GraphQLError(str(self._db.raise_exception))
         return await self._conversation_resolver.resolve_conversations(
             user_id=user_id,
             limit=limit
@@ -13,7 +13,6 @@ from app.utils.versioning import (
     extract_version,
     get_version_info,
     get_deprecation_message,
-    VERSION_SUNSET_DATES,
     DEFAULT_VERSION,
 )
 
@@ -33,16 +32,18 @@ def get_version_from_request(request: Request) -> APIVersion:
     return extract_version(path, headers)
 
 
-def add_version_headers(headers: Dict[str, str], version: APIVersion) -> None:
+def _build_version_headers(version: APIVersion) -> Dict[str, str]:
     """
-    Add version-related headers to response.
+    Build the version-related response headers for a version.
 
     Args:
-        headers: Headers dictionary to modify in place
         version: The API version used for the request
+
+    Returns:
+        Dictionary of header names to values
     """
     # Always add current version header
-    headers["X-API-Version"] = version.value
+    headers = {"X-API-Version": version.value}
 
     # Add deprecation headers if version is deprecated
     version_info = get_version_info(version)
@@ -54,10 +55,28 @@ def add_version_headers(headers: Dict[str, str], version: APIVersion) -> None:
             headers["Deprecation"] = "true"
 
         # Add Sunset header if available
-        sunset_date = VERSION_SUNSET_DATES.get(version)
-        if sunset_date:
-            headers["Sunset"] = sunset_date
-            headers["X-API-Sunset"] = sunset_date
+        if version_info.sunset_date:
+            headers["Sunset"] = version_info.sunset_date
+            headers["X-API-Sunset"] = version_info.sunset_date
+
+    return headers
+
+
+# Version headers are static per version, so build them once at import
+_VERSION_HEADERS: Dict[APIVersion, Dict[str, str]] = {
+    version: _build_version_headers(version) for version in APIVersion
+}
+
+
+def add_version_headers(headers: Dict[str, str], version: APIVersion) -> None:
+    """
+    Add version-related headers to response.
+
+    Args:
+        headers: Headers dictionary to modify in place
+        version: The API version used for the request
+    """
+    headers.update(_VERSION_HEADERS[version])
 
 
 class VersionMiddleware(BaseHTTPMiddleware):
@@ -120,22 +139,8 @@ class VersionMiddleware(BaseHTTPMiddleware):
         # Process the request
         response = await call_next(request)
 
-        # Add version headers to response
-        response.headers["X-API-Version"] = version.value
-
-        # Add deprecation headers if needed
-        version_info = get_version_info(version)
-        if version_info.deprecated:
-            deprecation_message = get_deprecation_message(version)
-            if deprecation_message:
-                response.headers["X-API-Deprecation-Warning"] = deprecation_message
-                response.headers["Deprecation"] = "true"
-
-            # Add Sunset header
-            sunset_date = VERSION_SUNSET_DATES.get(version)
-            if sunset_date:
-                response.headers["Sunset"] = sunset_date
-                response.headers["X-API-Sunset"] = sunset_date
+        # Add version (and deprecation/sunset) headers to response
+        response.headers.update(_VERSION_HEADERS[version])
 
         return response
 
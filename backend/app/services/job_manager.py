@@ -11,16 +11,26 @@ Job states:
 - RETRYING: Job being retried after failure
 """
 
-import uuid
 import asyncio
+import itertools
+import operator
+import secrets
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Optional, Callable, Any
 import logging
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Default size of the enqueue worker pool and its pending-job queue
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_QUEUED = 1000
+
+# Jobs kept before the least recently finished ones are evicted
+DEFAULT_MAX_JOBS = 10_000
+
 
 class JobStatus(Enum):
     """Enumeration of possible job states."""
@@ -31,15 +41,28 @@ class JobStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+# Serialized form of each status, looked up by Job.to_dict
+_STATUS_STR = {s: s.value for s in JobStatus}
+
+# Statuses a job finishes in, and the ones it may be retried from
+_TERMINAL = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
+_RETRYABLE = frozenset({JobStatus.FAILED})
+
+# Marks a _transition keyword that was not passed
+_UNSET = object()
+
+
+@dataclass(slots=True)
 class Job:
     """
     Represents a background job.
 
+    Slotted to keep per-job memory small when many jobs are tracked.
+
     Attributes:
-        id: Unique job identifier (UUID)
+        id: Unique job identifier ("<manager prefix>-<sequence>")
         task_name: Name of the registered task to execute
-        status: Current job status
+        status: Current job status (read-only; see JobManager._transition)
         created_at: Timestamp when job was created
         started_at: Timestamp when job started processing
         completed_at: Timestamp when job finished (success or failure)
@@ -51,7 +74,10 @@ class Job:
     """
     id: str
     task_name: str
-    status: JobStatus = JobStatus.PENDING
+    # Only JobManager._transition may write this: it also moves the job
+    # between the manager's status buckets, which pending_count and
+    # processing_count read. The public status property is read-only.
+    _status: JobStatus = field(default=JobStatus.PENDING, init=False)
     created_at: datetime = field(default_factory=datetime.utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -60,6 +86,17 @@ class Job:
     retry_count: int = 0
     max_retries: int = 3
     metadata: dict = field(default_factory=dict)
+    # Set while the job is COMPLETED or FAILED, so callers can await completion
+    _terminal: asyncio.Event = field(
+        default_factory=asyncio.Event, init=False, repr=False, compare=False
+    )
+
+    # to_dict keys, read from the attributes of the same name in one C-level call
+    _DICT_FIELDS = (
+        "id", "task_name", "status", "created_at", "started_at", "completed_at",
+        "result", "error", "retry_count", "can_retry", "metadata",
+    )
+    _dict_values = operator.attrgetter(*_DICT_FIELDS)
 
     def to_dict(self) -> dict:
         """
@@ -68,19 +105,24 @@ class Job:
         Returns:
             Dictionary with all job attributes serialized.
         """
-        return {
-            "id": self.id,
-            "task_name": self.task_name,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "result": self.result,
-            "error": self.error,
-            "retry_count": self.retry_count,
-            "can_retry": self.can_retry,
-            "metadata": self.metadata,
-        }
+        data = dict(zip(self._DICT_FIELDS, self._dict_values(self)))
+        data["status"] = _STATUS_STR[data["status"]]
+        data["created_at"] = data["created_at"].isoformat()
+        if data["started_at"] is not None:
+            data["started_at"] = data["started_at"].isoformat()
+        if data["completed_at"] is not None:
+            data["completed_at"] = data["completed_at"].isoformat()
+        return data
+
+    @property
+    def status(self) -> JobStatus:
+        """
+        Current job status.
+
+        Returns:
+            The job's JobStatus, changed only by JobManager._transition.
+        """
+        return self._status
 
     @property
     def can_retry(self) -> bool:
@@ -90,7 +132,7 @@ class Job:
         Returns:
             True if job is failed and hasn't exceeded max retries.
         """
-        return self.status == JobStatus.FAILED and self.retry_count < self.max_retries
+        return self.status in _RETRYABLE and self.retry_count < self.max_retries
 
     @property
     def is_terminal(self) -> bool:
@@ -100,7 +142,7 @@ class Job:
         Returns:
             True if job is completed or failed.
         """
-        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+        return self.status in _TERMINAL
 
 
 class JobManager:
@@ -111,16 +153,218 @@ class JobManager:
     - Register task functions
     - Create jobs for registered tasks
     - Execute jobs synchronously or asynchronously
+    - Enqueue jobs onto a bounded queue served by a fixed worker pool
     - Retry failed jobs
     - Cancel running jobs
     - Query job status
     """
 
-    def __init__(self):
-        """Initialize job manager with empty job and task stores."""
-        self._jobs: dict[str, Job] = {}
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+    ):
+        """
+        Initialize job manager with empty job and task stores.
+
+        Args:
+            max_workers: Number of workers executing enqueued jobs
+            max_queued: Maximum enqueued jobs waiting for a worker
+            max_jobs: Jobs kept before finished ones are evicted, oldest
+                first; pending and running jobs are never evicted
+        """
+        # Ordered by recency of finishing, so eviction pops from the front
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._max_jobs = max_jobs
         self._tasks: dict[str, Callable] = {}
-        self._running_tasks: dict[str, asyncio.Task] = {}
+        # Bound lookups for the hot paths; the dicts are only ever cleared,
+        # never replaced, so these stay valid
+        self._jobs_get = self._jobs.get
+        self._tasks_get = self._tasks.get
+        # Job ids are a random per-manager prefix plus a process-local counter
+        self._id_prefix = secrets.token_hex(4)
+        self._seq = itertools.count()
+        # Immutable snapshot of registered, non-blank task names, rebuilt on
+        # registration so create_job validates with a single set probe
+        self._task_names: frozenset[str] = frozenset()
+        # Futures handed out by enqueue, resolved by the worker pool
+        self._running_tasks: dict[str, asyncio.Future] = {}
+        # Worker pool, started lazily on the first enqueue in a loop
+        self._max_workers = max_workers
+        self._max_queued = max_queued
+        self._work_q: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        # Worker task currently executing each job, used by cancel
+        self._active: dict[str, asyncio.Task] = {}
+        # Job ids bucketed by status, maintained by _transition
+        self._by_status: dict[JobStatus, set[str]] = {s: set() for s in JobStatus}
+
+    def _transition(
+        self,
+        job: Job,
+        new: JobStatus,
+        *,
+        error: Any = _UNSET,
+        result: Any = _UNSET,
+        inc_retry: bool = False,
+    ) -> None:
+        """
+        Move a job to a new status, applying its related field updates in one pass.
+
+        Keeps the status buckets in sync. Entering PROCESSING stamps started_at
+        and entering COMPLETED/FAILED stamps completed_at. Field updates land
+        before the terminal event is set, so waiters never observe a
+        half-updated job.
+
+        Args:
+            job: Job to update
+            new: Status to transition to
+            error: New error message, if given
+            result: New result, if given
+            inc_retry: Whether to count another retry attempt
+        """
+        if error is not _UNSET:
+            job.error = error
+        if result is not _UNSET:
+            job.result = result
+        if inc_retry:
+            job.retry_count += 1
+
+        by_status = self._by_status
+        by_status[job.status].discard(job.id)
+        by_status[new].add(job.id)
+        job._status = new
+        if new in _TERMINAL:
+            job.completed_at = datetime.utcnow()
+            job._terminal.set()
+            self._jobs.move_to_end(job.id)
+            if len(self._jobs) > self._max_jobs:
+                self._evict(keep=job.id)
+        else:
+            if new == JobStatus.PROCESSING:
+                job.started_at = datetime.utcnow()
+            job._terminal.clear()
+
+    def _evict(self, keep: str) -> None:
+        """
+        Drop the least recently finished jobs until within max_jobs.
+
+        Args:
+            keep: Id of the job that just finished, which is never evicted
+        """
+        jobs = self._jobs
+        excess = len(jobs) - self._max_jobs
+        victims = []
+        for job_id, job in jobs.items():
+            if len(victims) >= excess or job_id == keep:
+                break
+            if job.status in _TERMINAL:
+                victims.append(job_id)
+        for job_id in victims:
+            job = jobs.pop(job_id)
+            self._by_status[job.status].discard(job_id)
+            self._running_tasks.pop(job_id, None)
+
+    def _ensure_workers(self, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+        """
+        Start (or restart) the worker pool on the given loop.
+
+        Args:
+            loop: Running event loop
+
+        Returns:
+            The work queue served by the pool
+        """
+        if not self._workers or self._workers[0].get_loop() is not loop:
+            self._work_q = asyncio.Queue(maxsize=self._max_queued)
+            self._workers = []
+        queue = self._work_q
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self._max_workers:
+            self._workers.append(loop.create_task(self._worker(queue)))
+        return queue
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """
+        Execute enqueued jobs until cancelled.
+
+        Each worker takes exactly one job per wakeup. Claiming more would
+        queue them behind a slow job while other workers sit idle.
+
+        Args:
+            queue: Work queue of (job_id, args, kwargs, future) items
+        """
+        while True:
+            job_id, args, kwargs, future = await queue.get()
+            try:
+                if not future.cancelled():
+                    await self._run(job_id, args, kwargs, future)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job_id: str, args: tuple, kwargs: dict, future: asyncio.Future) -> None:
+        """
+        Execute one job on a worker and resolve its future.
+
+        Args:
+            job_id: Job identifier
+            args: Positional arguments for task
+            kwargs: Keyword arguments for task
+            future: Future returned to the enqueue caller
+        """
+        worker = asyncio.current_task()
+        self._active[job_id] = worker
+        try:
+            result = await self.execute(job_id, *args, **kwargs)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # The worker itself is being shut down
+                future.cancel()
+                raise
+            # Only this job was cancelled; keep the worker serving the queue
+            # unless a shutdown cancel (aclose) arrived along with it
+            if worker.uncancel():
+                raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            self._active.pop(job_id, None)
+
+    def reset(self) -> None:
+        """Cancel running jobs and drop all jobs and registered tasks."""
+        for job_id in list(self._running_tasks):
+            self.cancel(job_id)
+        self._running_tasks.clear()
+        self._tasks.clear()
+        self._task_names = frozenset()
+        self._jobs.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+
+    async def aclose(self) -> None:
+        """
+        Stop the worker pool.
+
+        Workers are cancelled along with the jobs they are running and queued
+        jobs have their futures cancelled. The pool is restarted lazily if the
+        manager is used again.
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks left on another (closed) loop cannot be awaited from this one
+        workers = [w for w in self._workers if w.get_loop() is loop]
+        self._workers = []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        queue, self._work_q = self._work_q, None
+        while queue is not None and not queue.empty():
+            queue.get_nowait()[3].cancel()
+            queue.task_done()
 
     def register_task(self, name: str, func: Callable) -> None:
         """
@@ -131,6 +375,7 @@ class JobManager:
             func: Callable (sync or async) to execute
         """
         self._tasks[name] = func
+        self._task_names = frozenset(n for n in self._tasks if n.strip())
 
     def create_job(self, task_name: str, metadata: dict = None) -> Job:
         """
@@ -146,20 +391,19 @@ class JobManager:
         Raises:
             ValueError: If task_name is not registered or invalid
         """
-        # Validate task name
-        if not task_name or not task_name.strip():
-            raise ValueError(f"Unknown task: {task_name}")
-
-        if task_name not in self._tasks:
+        # Blank names never enter the snapshot, so one probe covers
+        # empty, whitespace-only and unregistered names alike
+        if task_name not in self._task_names:
             raise ValueError(f"Unknown task: {task_name}")
 
         job = Job(
-            id=str(uuid.uuid4()),
+            id=f"{self._id_prefix}-{next(self._seq)}",
             task_name=task_name,
             metadata=metadata if metadata is not None else {}
         )
         self._jobs[job.id] = job
-        logger.info(f"Created job {job.id} for task {task_name}")
+        self._by_status[job.status].add(job.id)
+        logger.info("Created job %s for task %s", job.id, task_name)
         return job
 
     def get_job(self, job_id: str) -> Optional[Job]:
@@ -172,7 +416,20 @@ class JobManager:
         Returns:
             Job instance or None if not found
         """
-        return self._jobs.get(job_id)
+        return self._jobs_get(job_id)
+
+    def list_by_status(self, status: JobStatus) -> list[Job]:
+        """
+        List jobs currently in a given status.
+
+        Args:
+            status: Status to filter by
+
+        Returns:
+            Jobs in that status, without scanning the other jobs
+        """
+        jobs = self._jobs
+        return [jobs[job_id] for job_id in self._by_status[status]]
 
     def get_status(self, job_id: str) -> Optional[dict]:
         """
@@ -184,8 +441,8 @@ class JobManager:
         Returns:
             Job status dict or None if not found
         """
-        job = self.get_job(job_id)
-        return job.to_dict() if job else None
+        job = self._jobs_get(job_id)
+        return job.to_dict() if job is not None else None
 
     async def execute(self, job_id: str, *args, **kwargs) -> Any:
         """
@@ -203,20 +460,19 @@ class JobManager:
             ValueError: If job not found or task not registered
             RuntimeError: If job is already processing
         """
-        job = self.get_job(job_id)
-        if not job:
+        job = self._jobs_get(job_id)
+        if job is None:
             raise ValueError(f"Job not found: {job_id}")
 
         if job.status == JobStatus.PROCESSING:
             raise RuntimeError(f"Job {job_id} is already processing")
 
-        task_func = self._tasks.get(job.task_name)
+        task_func = self._tasks_get(job.task_name)
         if not task_func:
             raise ValueError(f"Task not registered: {job.task_name}")
 
-        job.status = JobStatus.PROCESSING
-        job.started_at = datetime.utcnow()
-        logger.info(f"Starting job {job_id}")
+        self._transition(job, JobStatus.PROCESSING)
+        logger.info("Starting job %s", job_id)
 
         try:
             if asyncio.iscoroutinefunction(task_func):
@@ -224,21 +480,20 @@ class JobManager:
             else:
                 result = task_func(*args, **kwargs)
 
-            job.status = JobStatus.COMPLETED
-            job.completed_at = datetime.utcnow()
-            job.result = result
-            logger.info(f"Job {job_id} completed successfully")
+            self._transition(job, JobStatus.COMPLETED, result=result)
+            logger.info("Job %s completed successfully", job_id)
             return result
         except Exception as e:
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.utcnow()
-            job.error = str(e)
-            logger.error(f"Job {job_id} failed: {e}")
+            self._transition(job, JobStatus.FAILED, error=str(e))
+            logger.error("Job %s failed: %s", job_id, e)
             raise
 
-    async def enqueue(self, job_id: str, *args, **kwargs) -> asyncio.Task:
+    async def enqueue(self, job_id: str, *args, **kwargs) -> asyncio.Future:
         """
-        Enqueue job for background execution.
+        Enqueue job for background execution by the worker pool.
+
+        Returns the job's future without suspending unless max_queued jobs
+        are already waiting, in which case it waits for room.
 
         Args:
             job_id: Job identifier
@@ -246,13 +501,20 @@ class JobManager:
             **kwargs: Keyword arguments for task
 
         Returns:
-            asyncio.Task for the background execution
+            asyncio.Future resolved with the task result (or error)
         """
-        task = asyncio.create_task(self.execute(job_id, *args, **kwargs))
-        self._running_tasks[job_id] = task
-        return task
+        loop = asyncio.get_running_loop()
+        queue = self._ensure_workers(loop)
+        future = loop.create_future()
+        self._running_tasks[job_id] = future
+        item = (job_id, args, kwargs, future)
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            await queue.put(item)
+        return future
 
-    async def retry(self, job_id: str, *args, **kwargs) -> Optional[asyncio.Task]:
+    async def retry(self, job_id: str, *args, **kwargs) -> Optional[asyncio.Future]:
         """
         Retry a failed job.
 
@@ -262,22 +524,20 @@ class JobManager:
             **kwargs: Keyword arguments for task
 
         Returns:
-            asyncio.Task if retry started, None if not retryable
+            asyncio.Future if retry started, None if not retryable
 
         Raises:
             ValueError: If job not found
         """
-        job = self.get_job(job_id)
-        if not job:
+        job = self._jobs_get(job_id)
+        if job is None:
             raise ValueError(f"Job not found: {job_id}")
 
         if not job.can_retry:
             return None
 
-        job.retry_count += 1
-        job.status = JobStatus.RETRYING
-        job.error = None
-        logger.info(f"Retrying job {job_id} (attempt {job.retry_count})")
+        self._transition(job, JobStatus.RETRYING, error=None, inc_retry=True)
+        logger.info("Retrying job %s (attempt %s)", job_id, job.retry_count)
 
         return await self.enqueue(job_id, *args, **kwargs)
 
@@ -291,16 +551,18 @@ class JobManager:
         Returns:
             True if job was cancelled, False otherwise
         """
-        if job_id in self._running_tasks:
-            task = self._running_tasks[job_id]
-            if not task.done():
-                task.cancel()
-                job = self.get_job(job_id)
-                if job:
-                    job.status = JobStatus.FAILED
-                    job.error = "Cancelled by user"
-                return True
-        return False
+        task = self._running_tasks.get(job_id)
+        if task is None or task.done():
+            return False
+
+        task.cancel()
+        worker = self._active.get(job_id)
+        if worker is not None:
+            worker.cancel()
+        job = self._jobs_get(job_id)
+        if job is not None:
+            self._transition(job, JobStatus.FAILED, error="Cancelled by user")
+        return True
 
     @property
     def pending_count(self) -> int:
@@ -310,7 +572,7 @@ class JobManager:
         Returns:
             Number of jobs in PENDING state
         """
-        return sum(1 for j in self._jobs.values() if j.status == JobStatus.PENDING)
+        return len(self._by_status[JobStatus.PENDING])
 
     @property
     def processing_count(self) -> int:
@@ -320,7 +582,7 @@ class JobManager:
         Returns:
             Number of jobs in PROCESSING state
         """
-        return sum(1 for j in self._jobs.values() if j.status == JobStatus.PROCESSING)
+        return len(self._by_status[JobStatus.PROCESSING])
 
 
 # Singleton instance for application-wide job management
@@ -12,8 +12,12 @@ when users ask variations of the same question.
 
 from typing import Optional, Any, List
 import hashlib
+import uuid
 from dataclasses import dataclass, field
 
+# Outlives any answer TTL so a lapsed version never revives older answers
+CREATOR_VERSION_TTL = 30 * 24 * 3600
+
 
 @dataclass
 class CacheEntry:
@@ -24,10 +28,12 @@ class CacheEntry:
         query: The original query text
         response: The cached response for this query
         embedding: Optional embedding vector for semantic matching
+        creator_id: Creator the entry belongs to, None for unscoped entries
     """
     query: str
     response: Any
     embedding: List[float] = None
+    creator_id: Optional[str] = None
 
 
 class SemanticCache:
@@ -136,7 +142,109 @@ class SemanticCache:
 
         return result
 
-    def _find_similar(self, embedding: List[float]) -> Optional[CacheEntry]:
+    async def _creator_version(self, creator_id: str) -> str:
+        """
+        Get the current content version for a creator.
+
+        Args:
+            creator_id: The creator to look up
+
+        Returns:
+            Version token set by invalidate_creator(), "0" if never set
+        """
+        version = await self.cache_service.get("semantic_version", creator_id)
+        return version or "0"
+
+    def _creator_key(self, message: str, creator_id: str, version: str) -> str:
+        """
+        Create the exact-match key for a creator-scoped query.
+
+        The creator ID is kept outside the normalized hash so that IDs
+        differing only in case never share entries.
+
+        Args:
+            message: The user message
+            creator_id: The creator whose content answers the message
+            version: The creator's current content version
+
+        Returns:
+            Key of the form "{creator_id}:{version}:{query hash}"
+        """
+        return f"{creator_id}:{version}:{self._hash_query(message)}"
+
+    async def lookup(
+        self,
+        message: str,
+        creator_id: str,
+        embedding: List[float] = None
+    ) -> Optional[Any]:
+        """
+        Get a cached answer for a creator's user message.
+
+        Same strategy as get(), but only entries stored for the same
+        creator can match, so answers never leak across creators.
+
+        Args:
+            message: The user message to look up
+            creator_id: The creator the message is addressed to
+            embedding: Optional embedding vector for semantic matching
+
+        Returns:
+            Cached response if found, None otherwise
+        """
+        version = await self._creator_version(creator_id)
+        cached = await self.cache_service.get(
+            "semantic", self._creator_key(message, creator_id, version)
+        )
+        if cached is not None:
+            return cached
+
+        if embedding and self._entries:
+            similar = self._find_similar(embedding, creator_id)
+            if similar:
+                return similar.response
+
+        return None
+
+    async def store(
+        self,
+        message: str,
+        creator_id: str,
+        response: Any,
+        embedding: List[float] = None,
+        ttl: int = 3600
+    ) -> bool:
+        """
+        Cache an answer for a creator's user message.
+
+        Args:
+            message: The user message
+            creator_id: The creator the message is addressed to
+            response: The response to cache
+            embedding: Optional embedding vector for future semantic matching
+            ttl: Time-to-live in seconds (default: 1 hour)
+
+        Returns:
+            True if successfully cached
+        """
+        key = self._creator_key(message, creator_id, await self._creator_version(creator_id))
+        result = await self.cache_service.set("semantic", key, response, ttl)
+
+        if embedding:
+            self._entries[key] = CacheEntry(
+                query=message,
+                response=response,
+                embedding=embedding,
+                creator_id=creator_id
+            )
+
+        return result
+
+    def _find_similar(
+        self,
+        embedding: List[float],
+        creator_id: Optional[str] = None
+    ) -> Optional[CacheEntry]:
         """
         Find entry with similar embedding above threshold.
 
@@ -145,6 +253,8 @@ class SemanticCache:
 
         Args:
             embedding: The query embedding to match against
+            creator_id: Only consider entries stored for this creator
+                        (None matches unscoped entries from set())
 
         Returns:
             The best matching CacheEntry, or None if no match above threshold
@@ -153,7 +263,7 @@ class SemanticCache:
         best_score = 0.0
 
         for entry in self._entries.values():
-            if entry.embedding:
+            if entry.embedding and entry.creator_id == creator_id:
                 score = self._cosine_similarity(embedding, entry.embedding)
                 if score > best_score and score >= self.similarity_threshold:
                     best_score = score
@@ -206,6 +316,29 @@ class SemanticCache:
             del self._entries[key]
         return await self.cache_service.delete("semantic", key)
 
+    async def invalidate_creator(self, creator_id: str) -> bool:
+        """
+        Invalidate every cached answer for a creator.
+
+        Bumps the creator's content version so existing exact-match keys are
+        never read again (they expire on their own TTL), and drops the
+        creator's entries from the similarity index. Call this whenever the
+        creator's content changes.
+
+        Args:
+            creator_id: The creator whose answers are stale
+
+        Returns:
+            True if the new version was stored
+        """
+        self._entries = {
+            key: entry for key, entry in self._entries.items()
+            if entry.creator_id != creator_id
+        }
+        return await self.cache_service.set(
+            "semantic_version", creator_id, uuid.uuid4().hex, CREATOR_VERSION_TTL
+        )
+
     @property
     def entry_count(self) -> int:
         """
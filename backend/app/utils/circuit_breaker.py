@@ -14,6 +14,9 @@ from app.config.resilience import CircuitBreakerConfig, get_config
 
 logger = logging.getLogger(__name__)
 
+# Failure times are monotonic nanoseconds: immune to wall-clock jumps, int math
+NS_PER_SECOND = 1_000_000_000
+
 
 class CircuitState(Enum):
     """Possible states for a circuit breaker."""
@@ -22,12 +25,12 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing recovery
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitStats:
     """Statistics for a circuit breaker."""
     failures: int = 0
     successes: int = 0
-    last_failure_time: float = 0.0
+    last_failure_time: int = 0      # time.monotonic_ns() of the last failure
     consecutive_successes: int = 0
 
 
@@ -42,6 +45,9 @@ class CircuitBreakerError(Exception):
 class CircuitBreaker:
     """Circuit breaker implementation with three states."""
 
+    # Many breakers can live per process; skip the per-instance __dict__
+    __slots__ = ("service", "config", "_state", "_stats")
+
     def __init__(self, service: str, config: CircuitBreakerConfig = None):
         """
         Initialize a circuit breaker.
@@ -62,62 +68,83 @@ class CircuitBreaker:
         Checks if we should transition from OPEN to HALF_OPEN.
         """
         # Check if we should transition to half-open
-        if self._state == CircuitState.OPEN:
-            if time.time() - self._stats.last_failure_time >= self.config.timeout_seconds:
+        if self._state is CircuitState.OPEN:
+            elapsed_ns = time.monotonic_ns() - self._stats.last_failure_time
+            if elapsed_ns >= self.config.timeout_seconds * NS_PER_SECOND:
                 self._state = CircuitState.HALF_OPEN
-                logger.info(f"Circuit {self.service} transitioning to HALF_OPEN")
+                logger.info(
+                    f"Circuit {self.service} transitioning to HALF_OPEN",
+                    extra={'extra_fields': {
+                        'event': 'circuit_half_open',
+                        'service': self.service,
+                    }}
+                )
         return self._state
 
     @property
     def is_closed(self) -> bool:
         """Check if the circuit is closed (normal operation)."""
-        return self.state == CircuitState.CLOSED
+        return self.state is CircuitState.CLOSED
 
     @property
     def is_open(self) -> bool:
         """Check if the circuit is open (failing fast)."""
-        return self.state == CircuitState.OPEN
+        return self.state is CircuitState.OPEN
 
     @property
     def is_half_open(self) -> bool:
         """Check if the circuit is half-open (testing recovery)."""
-        return self.state == CircuitState.HALF_OPEN
+        return self.state is CircuitState.HALF_OPEN
 
     def allow_request(self) -> bool:
         """Check if request should be allowed through the circuit."""
-        return self.state != CircuitState.OPEN
+        return self.state is not CircuitState.OPEN
 
     def record_success(self):
         """Record a successful call through the circuit."""
-        if self._state == CircuitState.HALF_OPEN:
+        if self._state is CircuitState.HALF_OPEN:
             self._stats.consecutive_successes += 1
             if self._stats.consecutive_successes >= self.config.success_threshold:
                 self._close()
-        elif self._state == CircuitState.CLOSED:
+        elif self._state is CircuitState.CLOSED:
             self._stats.failures = 0
 
     def record_failure(self):
         """Record a failed call through the circuit."""
         self._stats.failures += 1
-        self._stats.last_failure_time = time.time()
+        self._stats.last_failure_time = time.monotonic_ns()
         self._stats.consecutive_successes = 0
 
-        if self._state == CircuitState.HALF_OPEN:
+        # One trip condition: any failure while probing, or the threshold when closed
+        if self._state is CircuitState.HALF_OPEN or (
+            self._state is CircuitState.CLOSED
+            and self._stats.failures >= self.config.failure_threshold
+        ):
             self._open()
-        elif self._state == CircuitState.CLOSED:
-            if self._stats.failures >= self.config.failure_threshold:
-                self._open()
 
     def _open(self):
         """Open the circuit (start failing fast)."""
         self._state = CircuitState.OPEN
-        logger.warning(f"Circuit {self.service} OPENED after {self._stats.failures} failures")
+        logger.warning(
+            f"Circuit {self.service} OPENED after {self._stats.failures} failures",
+            extra={'extra_fields': {
+                'event': 'circuit_open',
+                'service': self.service,
+                'failures': self._stats.failures,
+            }}
+        )
 
     def _close(self):
         """Close the circuit (return to normal operation)."""
         self._state = CircuitState.CLOSED
         self._stats = CircuitStats()
-        logger.info(f"Circuit {self.service} CLOSED after recovery")
+        logger.info(
+            f"Circuit {self.service} CLOSED after recovery",
+            extra={'extra_fields': {
+                'event': 'circuit_closed',
+                'service': self.service,
+            }}
+        )
 
     def reset(self):
         """Reset the circuit to closed state."""
@@ -126,10 +153,10 @@ class CircuitBreaker:
 
     def get_retry_after(self) -> float:
         """Get time until retry should be attempted."""
-        if self._state != CircuitState.OPEN:
+        if self._state is not CircuitState.OPEN:
             return 0.0
-        elapsed = time.time() - self._stats.last_failure_time
-        return max(0.0, self.config.timeout_seconds - elapsed)
+        elapsed_ns = time.monotonic_ns() - self._stats.last_failure_time
+        return max(0.0, self.config.timeout_seconds - elapsed_ns / NS_PER_SECOND)
 
     async def execute(self, func: Callable, *args, **kwargs) -> Any:
         """
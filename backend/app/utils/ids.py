@@ -0,0 +1,47 @@
+"""
+Identifier generation utilities.
+Provides time-ordered UUIDs so new rows land at the end of their indexes.
+"""
+
+import os
+import time
+import uuid
+
+# RFC 9562 UUIDv7 field layout
+_VERSION_7 = 0x7 << 76
+_VARIANT_RFC4122 = 0b10 << 62
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7.
+
+    The top 48 bits hold the Unix time in milliseconds and the next 12 bits
+    the sub-millisecond fraction, so IDs sort by creation time; the low 62
+    bits are random.
+
+    Returns:
+        A version 7 UUID
+    """
+    ns = time.time_ns()
+    ms, sub_ms_ns = divmod(ns, 1_000_000)
+    rand_a = (sub_ms_ns << 12) // 1_000_000
+    rand_b = int.from_bytes(os.urandom(8), "big") & _RAND_B_MASK
+    return uuid.UUID(int=(ms << 80) | _VERSION_7 | (rand_a << 64) | _VARIANT_RFC4122 | rand_b)
+
+
+def new_conversation_id() -> str:
+    """
+    Create an ID for a new conversation.
+
+    Returns:
+        A time-ordered UUIDv7 string
+    """
+    return str(uuid7())
+
+
+__all__ = [
+    "uuid7",
+    "new_conversation_id",
+]
@@ -4,6 +4,7 @@ Provides version detection, validation, and deprecation handling.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Set
 from enum import Enum
 import re
@@ -24,11 +25,14 @@ class APIVersion(Enum):
         return self in DEPRECATED_VERSIONS
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VersionInfo:
     """
     Information about an API version.
 
+    Frozen so the memoized instances returned by get_version_info
+    can be shared safely between callers.
+
     Attributes:
         version: The API version
         deprecated: Whether this version is deprecated
@@ -38,15 +42,6 @@ class VersionInfo:
     deprecated: bool = False
     sunset_date: Optional[str] = None
 
-    def __eq__(self, other):
-        if not isinstance(other, VersionInfo):
-            return False
-        return (
-            self.version == other.version and
-            self.deprecated == other.deprecated and
-            self.sunset_date == other.sunset_date
-        )
-
 
 # Current version (latest stable)
 CURRENT_VERSION = APIVersion.V2
@@ -65,10 +60,11 @@ VERSION_SUNSET_DATES: Dict[APIVersion, str] = {
     APIVersion.V1: "2025-12-31"
 }
 
-# Version path patterns
-VERSION_PATH_PATTERN = re.compile(r'^/v(\d+)(?:/|$)')
+# Version path pattern, compiled once at import (matches /v1, /v1/..., not /v10)
+VERSION_PATH_PATTERN = re.compile(r'^/(v\d+)(?:/|$)')
 
 
+@lru_cache(maxsize=32)
 def parse_version_string(version_str: Optional[str]) -> Optional[APIVersion]:
     """
     Parse a version string into an APIVersion enum.
@@ -116,15 +112,11 @@ def extract_version(path: str, headers: Dict[str, str]) -> APIVersion:
 
     # 1. Check path first: /v1/resource, /v2/resource
     if path:
-        # Match exact /v1 or /v2 at start of path
-        if path.startswith("/v2"):
-            # Ensure it's /v2 and not /v20 etc
-            if len(path) == 3 or path[3] == '/':
-                return APIVersion.V2
-        if path.startswith("/v1"):
-            # Ensure it's /v1 and not /v10 etc
-            if len(path) == 3 or path[3] == '/':
-                return APIVersion.V1
+        match = VERSION_PATH_PATTERN.match(path)
+        if match:
+            parsed = parse_version_string(match.group(1))
+            if parsed:
+                return parsed
 
     # 2. Check Accept-Version header
     accept_version = normalized_headers.get("accept-version")
@@ -151,6 +143,7 @@ def extract_version(path: str, headers: Dict[str, str]) -> APIVersion:
     return DEFAULT_VERSION
 
 
+@lru_cache(maxsize=16)
 def is_version_supported(version: APIVersion) -> bool:
     """
     Check if a version is currently supported.
@@ -164,6 +157,7 @@ def is_version_supported(version: APIVersion) -> bool:
     return version in SUPPORTED_VERSIONS
 
 
+@lru_cache(maxsize=None)
 def get_version_info(version: APIVersion) -> VersionInfo:
     """
     Get detailed information about an API version.
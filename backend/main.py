@@ -1,11 +1,11 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, AsyncGenerator
+from contextlib import asynccontextmanager
 import os
-import json
-import uuid
+import orjson
 from dotenv import load_dotenv
 import tempfile
 from pathlib import Path
@@ -14,12 +14,24 @@ from app.services.content_ingestion import ContentIngestionService
 from app.services.vector_store import VectorStoreService
 from app.agents.support_agent import SupportAgent
 from app.models.database import Database
+from app.services.cache import CacheService, RedisCache
+from app.services.semantic_cache import SemanticCache
+from app.services.job_manager import job_manager
 from app.utils.auth import get_current_user, get_optional_user, TokenData
+from app.utils.ids import new_conversation_id
 from app.routes.websocket import router as websocket_router
 
 load_dotenv()
 
-app = FastAPI(title="Creator Support AI Backend")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the background job workers and cancel jobs still queued
+    await job_manager.aclose()
+
+
+app = FastAPI(title="Creator Support AI Backend", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -34,6 +46,24 @@ ingestion_service = ContentIngestionService()
 support_agent = SupportAgent(vector_store)
 db = Database()
 
+# Answers to repeated stream questions, per creator; only with Redis, since
+# MemoryCache is unbounded and never evicts keys that are not read again
+_redis_url = os.getenv("REDIS_URL")
+response_cache: Optional[SemanticCache] = (
+    SemanticCache(CacheService(RedisCache(_redis_url))) if _redis_url else None
+)
+
+
+def get_db() -> Database:
+    """Return the shared database; tests swap it via app.dependency_overrides."""
+    return db
+
+
+def get_response_cache() -> Optional[SemanticCache]:
+    """Return the shared stream response cache; tests swap it via app.dependency_overrides."""
+    return response_cache
+
+
 # Include WebSocket router
 app.include_router(websocket_router)
 
@@ -62,7 +92,8 @@ async def upload_content(
     creator_id: str = Form(None),
     content_type: str = Form(...),
     title: str = Form(None),
-    user: Optional[TokenData] = Depends(get_optional_user)
+    user: Optional[TokenData] = Depends(get_optional_user),
+    cache: Optional[SemanticCache] = Depends(get_response_cache)
 ):
     # Use authenticated user's ID if available, otherwise fall back to form data (for demo)
     effective_creator_id = user.user_id if user else creator_id
@@ -86,6 +117,9 @@ async def upload_content(
             creator_id=effective_creator_id,
             metadata=metadata
         )
+        # New content can change the answers, so drop the cached ones
+        if cache is not None:
+            await cache.invalidate_creator(effective_creator_id)
 
         return {
             "status": "success",
@@ -101,7 +135,8 @@ async def upload_content(
 @app.post("/chat", response_model=ChatResponse)
 async def chat(
     message: ChatMessage,
-    user: Optional[TokenData] = Depends(get_optional_user)
+    user: Optional[TokenData] = Depends(get_optional_user),
+    database: Database = Depends(get_db)
 ):
     # Use authenticated user's ID if available, otherwise fall back to message data (for demo)
     effective_creator_id = user.user_id if user else message.creator_id
@@ -119,7 +154,7 @@ async def chat(
     )
 
     # Save conversation (works with or without database)
-    await db.save_conversation(
+    await database.save_conversation(
         creator_id=effective_creator_id,
         student_message=message.message,
         ai_response=result["response"],
@@ -128,7 +163,7 @@ async def chat(
     )
 
     # Update credit usage
-    await db.update_credit_usage(effective_creator_id, 1)
+    await database.update_credit_usage(effective_creator_id, 1)
 
     return ChatResponse(
         response=result["response"],
@@ -138,70 +173,143 @@ async def chat(
     )
 
 
+# SSE framing, encoded once; each event is "data: <json>\n\n"
+SSE_DATA_PREFIX = b"data: "
+SSE_SEPARATOR = b"\n\n"
+
+# The done frame's keys never change; only the values are encoded per request
+DONE_TEMPLATE = (
+    b'data: {"type":"done","sources":%b,"should_escalate":%b,"conversation_id":%b}\n\n'
+)
+
+# Keep proxies (nginx) from buffering the stream so each frame, including
+# the final done event, reaches the client as soon as it is yielded
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Words coalesced into one token event, trading per-frame overhead for granularity
+STREAM_TOKENS_PER_FRAME = 8
+
+
+async def persist_stream_result(
+    database,
+    cache: Optional[SemanticCache],
+    message_text: str,
+    creator_id: str,
+    result: dict,
+    cache_miss: bool
+) -> None:
+    """
+    Save a streamed exchange, charge the credit and cache confident answers.
+
+    Args:
+        database: Database to record the conversation and credit usage in
+        cache: Response cache, or None to skip caching
+        message_text: The student's question
+        creator_id: Creator the question was asked of
+        result: Agent result with response, sources and should_escalate
+        cache_miss: Whether the result came from the agent rather than the cache
+    """
+    await database.save_conversation(
+        creator_id=creator_id,
+        student_message=message_text,
+        ai_response=result["response"],
+        sources=result["sources"],
+        should_escalate=result["should_escalate"]
+    )
+
+    # Update credit usage
+    await database.update_credit_usage(creator_id, 1)
+
+    # Cache confident answers so the next identical question skips the agent
+    if cache_miss and cache is not None and not result["should_escalate"]:
+        await cache.store(message_text, creator_id, {
+            "response": result["response"],
+            "sources": result["sources"],
+            "should_escalate": result["should_escalate"]
+        })
+
+
 async def stream_chat_generator(
     message_text: str,
     creator_id: str,
     conversation_id: Optional[str],
-    database
-) -> AsyncGenerator[str, None]:
+    database,
+    cache: Optional[SemanticCache] = None,
+    background: Optional[BackgroundTasks] = None
+) -> AsyncGenerator[bytes, None]:
     """
     Async generator for SSE streaming chat responses.
     Yields token events followed by a final done event with metadata.
+    Frames are built as bytes in one reused buffer.
+    A cache hit replays the stored answer without calling the agent.
+    With background tasks, persistence runs after the response closes;
+    otherwise it runs inline once the done event is yielded.
     """
-    # Get response from support agent
-    result = await support_agent.process_query(
-        query=message_text,
-        creator_id=creator_id,
-        conversation_history=[]
-    )
+    result = await cache.lookup(message_text, creator_id) if cache is not None else None
+    cache_miss = result is None
+
+    if cache_miss:
+        # Get response from support agent
+        result = await support_agent.process_query(
+            query=message_text,
+            creator_id=creator_id,
+            conversation_history=[]
+        )
 
     response_text = result["response"]
     sources = result["sources"]
     should_escalate = result["should_escalate"]
 
     # Generate or use provided conversation_id
-    final_conversation_id = conversation_id or str(uuid.uuid4())
+    final_conversation_id = conversation_id or new_conversation_id()
+
+    buf = bytearray()
 
     # Stream tokens (split response into words/chunks)
     if response_text:
-        # Split response into words and yield each as a token event
+        # Split response into words and yield them as token events, packing
+        # up to STREAM_TOKENS_PER_FRAME words into each frame and mutating one
+        # event dict rather than building one per frame
+        token_event = {"type": "token", "content": None}
         words = response_text.split(" ")
-        for i, word in enumerate(words):
-            # Add space before word except for first word
-            token_content = word if i == 0 else " " + word
-            token_event = {"type": "token", "content": token_content}
-            yield f"data: {json.dumps(token_event)}\n\n"
+        for i in range(0, len(words), STREAM_TOKENS_PER_FRAME):
+            # Add space before each batch except the first
+            chunk = " ".join(words[i:i + STREAM_TOKENS_PER_FRAME])
+            token_event["content"] = chunk if i == 0 else " " + chunk
+            buf.clear()
+            buf += SSE_DATA_PREFIX
+            buf += orjson.dumps(token_event)
+            buf += SSE_SEPARATOR
+            yield bytes(buf)
+
+    # Queue persistence before the last frame so it runs once the body is sent
+    persist_args = (database, cache, message_text, creator_id, result, cache_miss)
+    if background is not None:
+        background.add_task(persist_stream_result, *persist_args)
 
     # Yield final done event with metadata
-    done_event = {
-        "type": "done",
-        "sources": sources,
-        "should_escalate": should_escalate,
-        "conversation_id": final_conversation_id
-    }
-    yield f"data: {json.dumps(done_event)}\n\n"
-
-    # Save conversation to database after streaming completes
-    await database.save_conversation(
-        creator_id=creator_id,
-        student_message=message_text,
-        ai_response=response_text,
-        sources=sources,
-        should_escalate=should_escalate
+    yield DONE_TEMPLATE % (
+        orjson.dumps(sources),
+        b"true" if should_escalate else b"false",
+        orjson.dumps(final_conversation_id)
     )
 
-    # Update credit usage
-    await database.update_credit_usage(creator_id, 1)
+    if background is None:
+        await persist_stream_result(*persist_args)
 
 
 @app.post("/chat/stream")
 async def chat_stream(
     message: ChatMessage,
-    user: Optional[TokenData] = Depends(get_optional_user)
+    background_tasks: BackgroundTasks,
+    user: Optional[TokenData] = Depends(get_optional_user),
+    database: Database = Depends(get_db),
+    cache: Optional[SemanticCache] = Depends(get_response_cache)
 ):
     """
     SSE streaming chat endpoint.
     Returns a stream of token events followed by a done event with metadata.
+    Database writes run as background tasks after the stream closes.
     """
     # Use authenticated user's ID if available, otherwise fall back to message data
     effective_creator_id = user.user_id if user else message.creator_id
@@ -217,9 +325,13 @@ async def chat_stream(
             message_text=message.message,
             creator_id=effective_creator_id,
             conversation_id=message.conversation_id,
-            database=db
+            database=database,
+            cache=cache,
+            background=background_tasks
         ),
-        media_type="text/event-stream; charset=utf-8"
+        media_type="text/event-stream; charset=utf-8",
+        headers=SSE_HEADERS,
+        background=background_tasks
     )
 
 
@@ -227,7 +339,8 @@ async def chat_stream(
 async def get_conversations(
     creator_id: str,
     limit: int = 50,
-    user: Optional[TokenData] = Depends(get_optional_user)
+    user: Optional[TokenData] = Depends(get_optional_user),
+    database: Database = Depends(get_db)
 ):
     # Use authenticated user's ID if available
     effective_creator_id = user.user_id if user else creator_id
@@ -239,7 +352,7 @@ async def get_conversations(
             detail="You can only access your own conversations"
         )
 
-    conversations = await db.get_conversations(effective_creator_id, limit)
+    conversations = await database.get_conversations(effective_creator_id, limit)
     return {"conversations": conversations}
 
 
@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures for backend tests.
 """
 
 import sys
+import httpx
 import pytest
 from unittest.mock import MagicMock
 
@@ -43,17 +44,41 @@ sys.modules['langgraph'] = mock_langgraph
 sys.modules['langgraph.graph'] = MagicMock()
 sys.modules['supabase'] = mock_supabase
 
-from fastapi.testclient import TestClient
-from main import app as fastapi_app
+# Imported after the sys.modules patching above so main sees the mocks
+from fastapi.testclient import TestClient  # noqa: E402
+from main import app as fastapi_app  # noqa: E402
+from tests.mocks.supabase_mock import MockDatabase  # noqa: E402
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     """Return the FastAPI application instance."""
     return fastapi_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
-    """Return a TestClient connected to the app."""
-    return TestClient(app)
+    """Return a TestClient connected to the app, shared across the session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+async def aclient(app):
+    """Return an httpx AsyncClient that drives the app in-process, shared across the session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def _session_db():
+    """Build the shared MockDatabase once per session."""
+    return MockDatabase()
+
+
+@pytest.fixture
+def mock_db(_session_db):
+    """Return the shared MockDatabase with its history cleared for this test."""
+    _session_db.reset_history()
+    return _session_db
@@ -1,2 +1,9 @@
 # Mock implementations for external services
 # This module provides test doubles for OpenAI, Pinecone, and Supabase services
+
+from datetime import datetime
+
+
+def timestamp_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a mock call_history timestamp (ns since epoch) to a datetime."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
@@ -3,8 +3,9 @@ Mock implementation for OpenAI ChatGPT service.
 PRD-002: Mock External Services
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 
 class MockOpenAIResponse:
@@ -26,8 +27,10 @@ class MockChatOpenAI:
         self.default_response = default_response
         self._responses = responses or []
         self._response_index = 0
-        self._raise_exception = raise_exception
-        self.call_history: List[Dict[str, Any]] = []
+        self.raise_exception = raise_exception
+        self.call_history: Deque[Dict[str, Any]] = deque()
+        # Shared response object for the default reply, reused across calls
+        self._default_ai_response = MockOpenAIResponse(default_response)
 
     @property
     def call_count(self) -> int:
@@ -35,23 +38,25 @@ class MockChatOpenAI:
 
     async def ainvoke(self, messages: List[Any]) -> MockOpenAIResponse:
         """Async invoke matching LangChain ChatOpenAI interface."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
         self.call_history.append({
             "messages": self._serialize_messages(messages),
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
-        # Get response content
+        # Sequenced responses get a fresh object per call
         if self._responses and self._response_index < len(self._responses):
             content = self._responses[self._response_index]
             self._response_index += 1
-        else:
-            content = self.default_response
+            return MockOpenAIResponse(content)
 
-        return MockOpenAIResponse(content)
+        # Default reply reuses the cached object unless default_response changed
+        if self._default_ai_response.content != self.default_response:
+            self._default_ai_response = MockOpenAIResponse(self.default_response)
+        return self._default_ai_response
 
     def _serialize_messages(self, messages: List[Any]) -> List[Dict[str, Any]]:
         """Convert messages to serializable format."""
@@ -67,5 +72,5 @@ class MockChatOpenAI:
 
     def reset_history(self) -> None:
         """Reset call history and response index."""
-        self.call_history = []
+        self.call_history.clear()
         self._response_index = 0
@@ -3,8 +3,9 @@ Mock implementation for Pinecone vector store service.
 PRD-002: Mock External Services
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 
 class MockDocument:
@@ -26,8 +27,8 @@ class MockVectorStoreService:
     ):
         self.documents = documents or []
         self._documents_with_scores = documents_with_scores
-        self._raise_exception = raise_exception
-        self.call_history: List[Dict[str, Any]] = []
+        self.raise_exception = raise_exception
+        self.call_history: Deque[Dict[str, Any]] = deque()
 
     @property
     def call_count(self) -> int:
@@ -41,8 +42,8 @@ class MockVectorStoreService:
         namespace: Optional[str] = None
     ) -> List[Tuple[MockDocument, float]]:
         """Search for similar documents, returning (doc, score) tuples."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
         self.call_history.append({
@@ -51,7 +52,7 @@ class MockVectorStoreService:
             "creator_id": creator_id,
             "k": k,
             "namespace": namespace,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         # Handle k=0 or empty documents
@@ -81,8 +82,8 @@ class MockVectorStoreService:
         namespace: Optional[str] = None
     ) -> Dict[str, Any]:
         """Add documents to the vector store."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
         self.call_history.append({
@@ -90,7 +91,7 @@ class MockVectorStoreService:
             "document_count": len(documents),
             "creator_id": creator_id,
             "namespace": namespace,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         # Add documents to internal storage
@@ -103,4 +104,4 @@ class MockVectorStoreService:
 
     def reset_history(self) -> None:
         """Reset call history."""
-        self.call_history = []
+        self.call_history.clear()
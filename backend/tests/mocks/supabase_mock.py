@@ -4,8 +4,10 @@ PRD-002: Mock External Services
 """
 
 import uuid
+import time
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Deque, Dict, List, Optional
 
 
 class MockDatabase:
@@ -17,15 +19,22 @@ class MockDatabase:
         raise_exception: Optional[Exception] = None
     ):
         self._connected = connected
-        self._raise_exception = raise_exception
+        self.raise_exception = raise_exception
         self._conversations: List[Dict[str, Any]] = []
         self._creators: Dict[str, Dict[str, Any]] = {}
-        self.call_history: List[Dict[str, Any]] = []
+        self.call_history: Deque[Dict[str, Any]] = deque()
+        # Same records as call_history, indexed by method name at append time.
+        self.calls_by_method: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     @property
     def call_count(self) -> int:
         return len(self.call_history)
 
+    def _record(self, call: Dict[str, Any]) -> None:
+        """Append a call to the history and to its per-method index."""
+        self.call_history.append(call)
+        self.calls_by_method[call["method"]].append(call)
+
     def is_connected(self) -> bool:
         """Check if database is connected."""
         return self._connected
@@ -52,18 +61,18 @@ class MockDatabase:
         should_escalate: bool
     ) -> Dict[str, Any]:
         """Save a conversation to the mock database."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
-        self.call_history.append({
+        self._record({
             "method": "save_conversation",
             "creator_id": creator_id,
             "student_message": student_message,
             "ai_response": ai_response,
             "sources": sources,
             "should_escalate": should_escalate,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         conversation = {
@@ -85,15 +94,15 @@ class MockDatabase:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get conversations for a creator."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
-        self.call_history.append({
+        self._record({
             "method": "get_conversations",
             "creator_id": creator_id,
             "limit": limit,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         # Filter by creator_id
@@ -106,15 +115,15 @@ class MockDatabase:
         credits_used: int
     ) -> Dict[str, Any]:
         """Update credit usage for a creator."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
-        self.call_history.append({
+        self._record({
             "method": "update_credit_usage",
             "creator_id": creator_id,
             "credits_used": credits_used,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         # Get or create creator
@@ -133,14 +142,14 @@ class MockDatabase:
 
     async def get_creator(self, creator_id: str) -> Optional[Dict[str, Any]]:
         """Get creator by ID."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
-        self.call_history.append({
+        self._record({
             "method": "get_creator",
             "creator_id": creator_id,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         return self._creators.get(creator_id)
@@ -151,15 +160,15 @@ class MockDatabase:
         name: str
     ) -> Dict[str, Any]:
         """Create a new creator."""
-        if self._raise_exception:
-            raise self._raise_exception
+        if self.raise_exception is not None:
+            raise self.raise_exception
 
         # Record the call
-        self.call_history.append({
+        self._record({
             "method": "create_creator",
             "email": email,
             "name": name,
-            "timestamp": datetime.now()
+            "timestamp": time.time_ns()
         })
 
         creator_id = str(uuid.uuid4())
@@ -176,6 +185,7 @@ class MockDatabase:
 
     def reset_history(self) -> None:
         """Reset call history and stored data."""
-        self.call_history = []
+        self.call_history.clear()
+        self.calls_by_method.clear()
         self._conversations = []
         self._creators = {}
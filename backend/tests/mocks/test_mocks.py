@@ -11,7 +11,9 @@ actual mock classes to make these tests pass.
 
 import pytest
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Protocol, Tuple, runtime_checkable
+
+from tests.mocks import timestamp_to_datetime
 
 # These imports will fail until mock implementations are created
 from tests.mocks.openai_mock import MockChatOpenAI, MockOpenAIResponse
@@ -19,6 +21,78 @@ from tests.mocks.pinecone_mock import MockVectorStoreService, MockDocument
 from tests.mocks.supabase_mock import MockDatabase
 
 
+# =============================================================================
+# Service Interfaces (what the real ChatOpenAI / VectorStoreService / Database expose)
+# =============================================================================
+
+@runtime_checkable
+class ChatModelLike(Protocol):
+    async def ainvoke(self, *args, **kwargs): ...
+
+
+@runtime_checkable
+class VectorStoreLike(Protocol):
+    async def similarity_search(self, *args, **kwargs): ...
+    async def add_documents(self, *args, **kwargs): ...
+
+
+@runtime_checkable
+class DatabaseLike(Protocol):
+    def is_connected(self): ...
+    async def create_creator(self, *args, **kwargs): ...
+    async def get_creator(self, *args, **kwargs): ...
+    async def save_conversation(self, *args, **kwargs): ...
+    async def get_conversations(self, *args, **kwargs): ...
+    async def update_credit_usage(self, *args, **kwargs): ...
+
+
+# =============================================================================
+# Shared Mock Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def _llm_pool():
+    """Single MockChatOpenAI instance shared across the session."""
+    return MockChatOpenAI()
+
+
+@pytest.fixture(scope="session")
+def _vs_pool():
+    """Single MockVectorStoreService instance shared across the session."""
+    return MockVectorStoreService()
+
+
+@pytest.fixture(scope="session")
+def _db_pool():
+    """Single MockDatabase instance shared across the session."""
+    return MockDatabase()
+
+
+@pytest.fixture
+def llm(_llm_pool):
+    """Shared MockChatOpenAI with call history and simulated errors reset."""
+    _llm_pool.reset_history()
+    _llm_pool.raise_exception = None
+    return _llm_pool
+
+
+@pytest.fixture
+def vs(_vs_pool):
+    """Shared MockVectorStoreService with history, documents and errors reset."""
+    _vs_pool.reset_history()
+    _vs_pool.documents = []
+    _vs_pool.raise_exception = None
+    return _vs_pool
+
+
+@pytest.fixture
+def db(_db_pool):
+    """Shared MockDatabase with history, stored data and errors reset."""
+    _db_pool.reset_history()
+    _db_pool.raise_exception = None
+    return _db_pool
+
+
 # =============================================================================
 # AC-1: MockOpenAI Tests - Returns predictable mock response without API call
 # =============================================================================
@@ -37,7 +111,6 @@ class TestMockOpenAI:
         mock_llm = MockChatOpenAI(default_response=custom_response)
         assert mock_llm.default_response == custom_response
 
-    @pytest.mark.asyncio
     async def test_mock_openai_ainvoke_returns_response_object(self):
         """ainvoke should return object with .content attribute."""
         mock_llm = MockChatOpenAI(default_response="Test response content")
@@ -48,7 +121,6 @@ class TestMockOpenAI:
         assert hasattr(response, "content")
         assert response.content == "Test response content"
 
-    @pytest.mark.asyncio
     async def test_mock_openai_ainvoke_with_message_objects(self):
         """ainvoke should handle LangChain message objects."""
         mock_llm = MockChatOpenAI(default_response="Response to messages")
@@ -67,7 +139,6 @@ class TestMockOpenAI:
 
         assert response.content == "Response to messages"
 
-    @pytest.mark.asyncio
     async def test_mock_openai_no_actual_api_call(self):
         """Mock should NOT make any actual HTTP/API calls."""
         mock_llm = MockChatOpenAI()
@@ -79,7 +150,6 @@ class TestMockOpenAI:
         assert response is not None
         # If this test takes more than milliseconds, something is wrong
 
-    @pytest.mark.asyncio
     async def test_mock_openai_sequential_responses(self):
         """Mock should support returning different responses in sequence."""
         responses = ["First response", "Second response", "Third response"]
@@ -89,7 +159,6 @@ class TestMockOpenAI:
             result = await mock_llm.ainvoke([{"role": "user", "content": "test"}])
             assert result.content == expected
 
-    @pytest.mark.asyncio
     async def test_mock_openai_response_object_type(self):
         """Response should be MockOpenAIResponse type."""
         mock_llm = MockChatOpenAI()
@@ -119,7 +188,6 @@ class TestMockPinecone:
         mock_vs = MockVectorStoreService(documents=docs)
         assert len(mock_vs.documents) == 2
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_similarity_search_returns_list(self):
         """similarity_search should return a list."""
         mock_vs = MockVectorStoreService()
@@ -132,7 +200,6 @@ class TestMockPinecone:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_similarity_search_returns_tuples(self):
         """similarity_search should return List[(Document, score)]."""
         docs = [
@@ -155,7 +222,6 @@ class TestMockPinecone:
             assert hasattr(doc, "metadata")
             assert isinstance(score, float)
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_respects_k_parameter(self):
         """similarity_search should return at most k results."""
         docs = [
@@ -172,7 +238,6 @@ class TestMockPinecone:
 
         assert len(results) <= 3
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_scores_between_0_and_1(self):
         """Scores should be between 0.0 and 1.0."""
         docs = [
@@ -189,7 +254,6 @@ class TestMockPinecone:
         for doc, score in results:
             assert 0.0 <= score <= 1.0
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_empty_results(self):
         """Mock should handle no documents gracefully."""
         mock_vs = MockVectorStoreService(documents=[])
@@ -202,7 +266,6 @@ class TestMockPinecone:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_with_custom_scores(self):
         """Mock should allow setting custom scores for documents."""
         docs_with_scores = [
@@ -222,7 +285,6 @@ class TestMockPinecone:
         assert results[1][1] == 0.75
         assert results[2][1] == 0.55
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_add_documents(self):
         """Mock should support adding documents."""
         mock_vs = MockVectorStoreService()
@@ -272,7 +334,6 @@ class TestMockSupabase:
         mock_db = MockDatabase(connected=False)
         assert mock_db.is_connected() is False
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_save_conversation(self):
         """save_conversation should return data matching expected schema."""
         mock_db = MockDatabase()
@@ -294,7 +355,6 @@ class TestMockSupabase:
         assert result["should_escalate"] is False
         assert "created_at" in result
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_save_conversation_with_escalation(self):
         """save_conversation should correctly store escalation flag."""
         mock_db = MockDatabase()
@@ -309,7 +369,6 @@ class TestMockSupabase:
 
         assert result["should_escalate"] is True
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_get_conversations(self):
         """get_conversations should return list of conversations."""
         mock_db = MockDatabase()
@@ -335,7 +394,6 @@ class TestMockSupabase:
         assert isinstance(results, list)
         assert len(results) == 2
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_get_conversations_respects_limit(self):
         """get_conversations should respect limit parameter."""
         mock_db = MockDatabase()
@@ -354,7 +412,6 @@ class TestMockSupabase:
 
         assert len(results) <= 5
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_get_conversations_filters_by_creator(self):
         """get_conversations should filter by creator_id."""
         mock_db = MockDatabase()
@@ -382,7 +439,6 @@ class TestMockSupabase:
         assert results_a[0]["creator_id"] == "creator-A"
         assert results_b[0]["creator_id"] == "creator-B"
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_update_credit_usage(self):
         """update_credit_usage should return updated credits."""
         mock_db = MockDatabase()
@@ -398,7 +454,6 @@ class TestMockSupabase:
         assert result is not None
         assert result["credits_remaining"] == 90
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_update_credit_usage_multiple_times(self):
         """Credits should decrease correctly with multiple updates."""
         mock_db = MockDatabase()
@@ -410,7 +465,6 @@ class TestMockSupabase:
 
         assert result["credits_remaining"] == 40
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_update_credit_usage_no_negative(self):
         """Credits should not go below zero."""
         mock_db = MockDatabase()
@@ -420,7 +474,6 @@ class TestMockSupabase:
 
         assert result["credits_remaining"] == 0
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_get_creator(self):
         """get_creator should return creator data."""
         mock_db = MockDatabase()
@@ -432,7 +485,6 @@ class TestMockSupabase:
         assert result["id"] == "creator-123"
         assert result["credits_remaining"] == 75
 
-    @pytest.mark.asyncio
     async def test_mock_supabase_create_creator(self):
         """create_creator should return new creator data."""
         mock_db = MockDatabase()
@@ -457,82 +509,64 @@ class TestMockSupabase:
 class TestCallHistoryTracking:
     """Tests for call history tracking across all mocks."""
 
-    @pytest.mark.asyncio
-    async def test_openai_tracks_call_history(self):
+    async def test_openai_tracks_call_history(self, llm):
         """MockChatOpenAI should track all calls."""
-        mock_llm = MockChatOpenAI()
+        await llm.ainvoke([{"role": "user", "content": "First call"}])
+        await llm.ainvoke([{"role": "user", "content": "Second call"}])
 
-        await mock_llm.ainvoke([{"role": "user", "content": "First call"}])
-        await mock_llm.ainvoke([{"role": "user", "content": "Second call"}])
+        assert len(llm.call_history) == 2
+        assert llm.call_history[0]["messages"][0]["content"] == "First call"
+        assert llm.call_history[1]["messages"][0]["content"] == "Second call"
 
-        assert len(mock_llm.call_history) == 2
-        assert mock_llm.call_history[0]["messages"][0]["content"] == "First call"
-        assert mock_llm.call_history[1]["messages"][0]["content"] == "Second call"
-
-    @pytest.mark.asyncio
-    async def test_openai_call_history_includes_timestamp(self):
+    async def test_openai_call_history_includes_timestamp(self, llm):
         """Call history should include timestamps."""
-        mock_llm = MockChatOpenAI()
+        await llm.ainvoke([{"role": "user", "content": "Test"}])
 
-        await mock_llm.ainvoke([{"role": "user", "content": "Test"}])
+        assert "timestamp" in llm.call_history[0]
+        assert isinstance(llm.call_history[0]["timestamp"], int)
+        assert isinstance(timestamp_to_datetime(llm.call_history[0]["timestamp"]), datetime)
 
-        assert "timestamp" in mock_llm.call_history[0]
-        assert isinstance(mock_llm.call_history[0]["timestamp"], datetime)
-
-    def test_openai_call_count(self):
+    def test_openai_call_count(self, llm):
         """MockChatOpenAI should provide call count."""
-        mock_llm = MockChatOpenAI()
-        assert mock_llm.call_count == 0
+        assert llm.call_count == 0
 
-    @pytest.mark.asyncio
-    async def test_openai_call_count_increments(self):
+    async def test_openai_call_count_increments(self, llm):
         """Call count should increment with each call."""
-        mock_llm = MockChatOpenAI()
+        await llm.ainvoke([])
+        assert llm.call_count == 1
 
-        await mock_llm.ainvoke([])
-        assert mock_llm.call_count == 1
+        await llm.ainvoke([])
+        assert llm.call_count == 2
 
-        await mock_llm.ainvoke([])
-        assert mock_llm.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_pinecone_tracks_similarity_search_calls(self):
+    async def test_pinecone_tracks_similarity_search_calls(self, vs):
         """MockVectorStoreService should track similarity_search calls."""
-        mock_vs = MockVectorStoreService()
+        await vs.similarity_search("query 1", "creator-1", k=4)
+        await vs.similarity_search("query 2", "creator-2", k=2)
 
-        await mock_vs.similarity_search("query 1", "creator-1", k=4)
-        await mock_vs.similarity_search("query 2", "creator-2", k=2)
+        assert len(vs.call_history) == 2
+        assert vs.call_history[0]["method"] == "similarity_search"
+        assert vs.call_history[0]["query"] == "query 1"
+        assert vs.call_history[0]["creator_id"] == "creator-1"
+        assert vs.call_history[0]["k"] == 4
 
-        assert len(mock_vs.call_history) == 2
-        assert mock_vs.call_history[0]["method"] == "similarity_search"
-        assert mock_vs.call_history[0]["query"] == "query 1"
-        assert mock_vs.call_history[0]["creator_id"] == "creator-1"
-        assert mock_vs.call_history[0]["k"] == 4
-
-    @pytest.mark.asyncio
-    async def test_pinecone_tracks_add_documents_calls(self):
+    async def test_pinecone_tracks_add_documents_calls(self, vs):
         """MockVectorStoreService should track add_documents calls."""
-        mock_vs = MockVectorStoreService()
         docs = [MockDocument(page_content="Test", metadata={})]
 
-        await mock_vs.add_documents(docs, "creator-123")
+        await vs.add_documents(docs, "creator-123")
 
         assert any(
             call["method"] == "add_documents"
-            for call in mock_vs.call_history
+            for call in vs.call_history
         )
 
-    def test_pinecone_call_count(self):
+    def test_pinecone_call_count(self, vs):
         """MockVectorStoreService should provide call count."""
-        mock_vs = MockVectorStoreService()
-        assert mock_vs.call_count == 0
+        assert vs.call_count == 0
 
-    @pytest.mark.asyncio
-    async def test_supabase_tracks_save_conversation_calls(self):
+    async def test_supabase_tracks_save_conversation_calls(self, db):
         """MockDatabase should track save_conversation calls."""
-        mock_db = MockDatabase()
-
-        await mock_db.save_conversation(
+        await db.save_conversation(
             creator_id="c1",
             student_message="Q",
             ai_response="A",
@@ -540,58 +574,50 @@ class TestCallHistoryTracking:
             should_escalate=False
         )
 
-        assert len(mock_db.call_history) >= 1
-        save_calls = [c for c in mock_db.call_history if c["method"] == "save_conversation"]
-        assert len(save_calls) == 1
-        assert save_calls[0]["creator_id"] == "c1"
+        assert len(db.call_history) >= 1
+        assert len(db.calls_by_method["save_conversation"]) == 1
+        save_call = db.calls_by_method["save_conversation"][0]
+        assert save_call["creator_id"] == "c1"
+        assert save_call is db.call_history[-1]
 
-    @pytest.mark.asyncio
-    async def test_supabase_tracks_all_method_calls(self):
+    async def test_supabase_tracks_all_method_calls(self, db):
         """MockDatabase should track calls to all methods."""
-        mock_db = MockDatabase()
-
-        await mock_db.create_creator("test@test.com", "Test")
-        await mock_db.get_creator("creator-1")
-        await mock_db.save_conversation("c1", "Q", "A", [], False)
-        await mock_db.get_conversations("c1")
-        await mock_db.update_credit_usage("c1", 5)
-
-        methods_called = [c["method"] for c in mock_db.call_history]
-
-        assert "create_creator" in methods_called
-        assert "get_creator" in methods_called
-        assert "save_conversation" in methods_called
-        assert "get_conversations" in methods_called
-        assert "update_credit_usage" in methods_called
-
-    def test_supabase_call_count(self):
+        await db.create_creator("test@test.com", "Test")
+        await db.get_creator("creator-1")
+        await db.save_conversation("c1", "Q", "A", [], False)
+        await db.get_conversations("c1")
+        await db.update_credit_usage("c1", 5)
+
+        methods_called = {c["method"] for c in db.call_history}
+
+        assert {
+            "create_creator",
+            "get_creator",
+            "save_conversation",
+            "get_conversations",
+            "update_credit_usage",
+        } <= methods_called
+
+    def test_supabase_call_count(self, db):
         """MockDatabase should provide call count."""
-        mock_db = MockDatabase()
-        assert mock_db.call_count == 0
+        assert db.call_count == 0
 
-    def test_all_mocks_have_reset_history_method(self):
+    def test_all_mocks_have_reset_history_method(self, llm, vs, db):
         """All mocks should have a method to reset call history."""
-        mock_llm = MockChatOpenAI()
-        mock_vs = MockVectorStoreService()
-        mock_db = MockDatabase()
-
-        assert hasattr(mock_llm, "reset_history")
-        assert hasattr(mock_vs, "reset_history")
-        assert hasattr(mock_db, "reset_history")
+        assert hasattr(llm, "reset_history")
+        assert hasattr(vs, "reset_history")
+        assert hasattr(db, "reset_history")
 
-    @pytest.mark.asyncio
-    async def test_reset_history_clears_calls(self):
+    async def test_reset_history_clears_calls(self, llm):
         """reset_history should clear all tracked calls."""
-        mock_llm = MockChatOpenAI()
-
-        await mock_llm.ainvoke([])
-        await mock_llm.ainvoke([])
-        assert mock_llm.call_count == 2
+        await llm.ainvoke([])
+        await llm.ainvoke([])
+        assert llm.call_count == 2
 
-        mock_llm.reset_history()
+        llm.reset_history()
 
-        assert mock_llm.call_count == 0
-        assert len(mock_llm.call_history) == 0
+        assert llm.call_count == 0
+        assert len(llm.call_history) == 0
 
 
 # =============================================================================
@@ -601,23 +627,18 @@ class TestCallHistoryTracking:
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
-    @pytest.mark.asyncio
-    async def test_openai_with_empty_messages(self):
+    async def test_openai_with_empty_messages(self, llm):
         """Mock should handle empty message list."""
-        mock_llm = MockChatOpenAI()
-
-        response = await mock_llm.ainvoke([])
+        response = await llm.ainvoke([])
 
         assert response is not None
         assert hasattr(response, "content")
 
-    @pytest.mark.asyncio
-    async def test_pinecone_with_zero_k(self):
+    async def test_pinecone_with_zero_k(self, vs):
         """Mock should handle k=0."""
-        docs = [MockDocument(page_content="Test", metadata={})]
-        mock_vs = MockVectorStoreService(documents=docs)
+        vs.documents = [MockDocument(page_content="Test", metadata={})]
 
-        results = await mock_vs.similarity_search(
+        results = await vs.similarity_search(
             query="test",
             creator_id="creator-123",
             k=0
@@ -625,12 +646,9 @@ class TestEdgeCases:
 
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_pinecone_with_empty_query(self):
+    async def test_pinecone_with_empty_query(self, vs):
         """Mock should handle empty query string."""
-        mock_vs = MockVectorStoreService()
-
-        results = await mock_vs.similarity_search(
+        results = await vs.similarity_search(
             query="",
             creator_id="creator-123",
             k=4
@@ -638,49 +656,45 @@ class TestEdgeCases:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
-    async def test_supabase_get_nonexistent_creator(self):
+    async def test_supabase_get_nonexistent_creator(self, db):
         """Mock should handle getting non-existent creator."""
-        mock_db = MockDatabase()
-
-        result = await mock_db.get_creator("nonexistent-id")
+        result = await db.get_creator("nonexistent-id")
 
         # Should return None or default creator, not raise exception
         # Behavior matches the real Database class fallback
 
-    @pytest.mark.asyncio
-    async def test_supabase_conversations_for_nonexistent_creator(self):
+    async def test_supabase_conversations_for_nonexistent_creator(self, db):
         """Mock should handle getting conversations for non-existent creator."""
-        mock_db = MockDatabase()
-
-        results = await mock_db.get_conversations("nonexistent-id")
+        results = await db.get_conversations("nonexistent-id")
 
         assert isinstance(results, list)
         assert len(results) == 0
 
-    @pytest.mark.asyncio
-    async def test_openai_exception_simulation(self):
+    async def test_openai_exception_simulation(self, llm):
         """Mock should support simulating exceptions."""
-        mock_llm = MockChatOpenAI(raise_exception=ValueError("Simulated API error"))
+        llm.raise_exception = ValueError("Simulated API error")
 
         with pytest.raises(ValueError, match="Simulated API error"):
-            await mock_llm.ainvoke([])
+            await llm.ainvoke([])
 
-    @pytest.mark.asyncio
-    async def test_pinecone_exception_simulation(self):
+    async def test_pinecone_exception_simulation(self, vs):
         """Mock should support simulating exceptions."""
-        mock_vs = MockVectorStoreService(raise_exception=ConnectionError("Simulated connection error"))
+        vs.raise_exception = ConnectionError("Simulated connection error")
 
         with pytest.raises(ConnectionError, match="Simulated connection error"):
-            await mock_vs.similarity_search("test", "creator-123", k=4)
+            await vs.similarity_search("test", "creator-123", k=4)
 
-    @pytest.mark.asyncio
-    async def test_supabase_exception_simulation(self):
+    async def test_supabase_exception_simulation(self, db):
         """Mock should support simulating exceptions."""
-        mock_db = MockDatabase(raise_exception=TimeoutError("Simulated timeout"))
+        db.raise_exception = TimeoutError("Simulated timeout")
 
         with pytest.raises(TimeoutError, match="Simulated timeout"):
-            await mock_db.save_conversation("c1", "Q", "A", [], False)
+            await db.save_conversation("c1", "Q", "A", [], False)
+
+    def test_constructor_exception_still_supported(self):
+        """Passing raise_exception to the constructor sets the same attribute."""
+        error = ValueError("Simulated API error")
+        assert MockChatOpenAI(raise_exception=error).raise_exception is error
 
 
 # =============================================================================
@@ -690,34 +704,15 @@ class TestEdgeCases:
 class TestMockInterfaceCompatibility:
     """Tests ensuring mocks are compatible with real service interfaces."""
 
-    def test_mock_openai_has_ainvoke_method(self):
-        """MockChatOpenAI must have ainvoke method matching ChatOpenAI."""
-        mock_llm = MockChatOpenAI()
-
-        assert hasattr(mock_llm, "ainvoke")
-        assert callable(mock_llm.ainvoke)
-
-    def test_mock_pinecone_has_required_methods(self):
-        """MockVectorStoreService must have methods matching VectorStoreService."""
-        mock_vs = MockVectorStoreService()
-
-        assert hasattr(mock_vs, "similarity_search")
-        assert hasattr(mock_vs, "add_documents")
-        assert callable(mock_vs.similarity_search)
-        assert callable(mock_vs.add_documents)
-
-    def test_mock_supabase_has_required_methods(self):
-        """MockDatabase must have methods matching Database class."""
-        mock_db = MockDatabase()
-
-        assert hasattr(mock_db, "is_connected")
-        assert hasattr(mock_db, "create_creator")
-        assert hasattr(mock_db, "get_creator")
-        assert hasattr(mock_db, "save_conversation")
-        assert hasattr(mock_db, "get_conversations")
-        assert hasattr(mock_db, "update_credit_usage")
+    @pytest.mark.parametrize("mock_factory,protocol", [
+        (MockChatOpenAI, ChatModelLike),
+        (MockVectorStoreService, VectorStoreLike),
+        (MockDatabase, DatabaseLike),
+    ], ids=["openai", "pinecone", "supabase"])
+    def test_mock_satisfies_service_interface(self, mock_factory, protocol):
+        """Each mock must expose the methods of the real service it replaces."""
+        assert isinstance(mock_factory(), protocol)
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_similarity_search_signature(self):
         """similarity_search should accept query, creator_id, k, and optional namespace."""
         mock_vs = MockVectorStoreService()
@@ -737,7 +732,6 @@ class TestMockInterfaceCompatibility:
             namespace="custom-namespace"
         )
 
-    @pytest.mark.asyncio
     async def test_mock_pinecone_add_documents_signature(self):
         """add_documents should accept documents, creator_id, and optional namespace."""
         mock_vs = MockVectorStoreService()
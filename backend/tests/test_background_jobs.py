@@ -16,20 +16,29 @@ import pytest
 import asyncio
 from datetime import datetime
 from unittest.mock import MagicMock, AsyncMock, patch
-import uuid
+
+from app.services.job_manager import JobStatus
 
 
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def job_manager():
-    """Create a fresh JobManager instance for each test."""
+    """Create one JobManager instance shared by the module."""
     from app.services.job_manager import JobManager
     return JobManager()
 
 
+@pytest.fixture(autouse=True)
+async def _reset(job_manager):
+    """Wipe registered tasks and jobs and stop the workers after each test."""
+    yield
+    job_manager.reset()
+    await job_manager.aclose()
+
+
 @pytest.fixture
 def sample_task():
     """Create a simple synchronous task for testing."""
@@ -38,11 +47,18 @@ def sample_task():
     return task
 
 
+@pytest.fixture
+def job_with_task(job_manager, sample_task):
+    """Shared JobManager with sample_task registered as 'test_task'."""
+    job_manager.register_task("test_task", sample_task)
+    return job_manager
+
+
 @pytest.fixture
 def sample_async_task():
     """Create a simple async task for testing."""
     async def task(value: int) -> dict:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)  # Yield to the loop without idling
         return {"result": value * 2}
     return task
 
@@ -59,20 +75,36 @@ def failing_task():
 def async_failing_task():
     """Create an async task that always fails."""
     async def task():
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)  # Yield to the loop without idling
         raise ValueError("Async task failed intentionally")
     return task
 
 
 @pytest.fixture
-def slow_task():
+def started():
+    """Event set by slow_task once it has begun running."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+def slow_task(started):
     """Create a slow async task for testing cancellation."""
     async def task():
+        started.set()
         await asyncio.sleep(10)  # Very long delay
         return {"result": "completed"}
     return task
 
 
+async def _run_failing(jm, job_id):
+    """Execute a job expected to fail and return the ValueError it raised."""
+    try:
+        await jm.execute(job_id)
+    except ValueError as e:
+        return e
+    raise AssertionError("expected ValueError")
+
+
 # =============================================================================
 # Job Creation Tests
 # =============================================================================
@@ -80,71 +112,57 @@ def slow_task():
 class TestJobCreation:
     """Tests for job creation functionality."""
 
-    def test_create_job_returns_job_object(self, job_manager, sample_task):
+    def test_create_job_returns_job_object(self, job_with_task):
         """Creating a job should return a Job object."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert job is not None
 
-    def test_create_job_has_unique_id(self, job_manager, sample_task):
+    def test_create_job_has_unique_id(self, job_with_task):
         """Each job should have a unique ID."""
-        job_manager.register_task("test_task", sample_task)
-        job1 = job_manager.create_job("test_task")
-        job2 = job_manager.create_job("test_task")
+        job1 = job_with_task.create_job("test_task")
+        job2 = job_with_task.create_job("test_task")
 
         assert job1.id != job2.id
 
-    def test_create_job_id_is_valid_uuid(self, job_manager, sample_task):
-        """Job ID should be a valid UUID."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+    def test_create_job_id_has_manager_prefix(self, job_with_task):
+        """Job ID should be the manager's prefix plus a sequence number."""
+        job1 = job_with_task.create_job("test_task")
+        job2 = job_with_task.create_job("test_task")
 
-        # Should not raise
-        uuid.UUID(job.id)
+        prefix, seq = job1.id.rsplit("-", 1)
+        assert prefix == job_with_task._id_prefix
+        assert job2.id == f"{prefix}-{int(seq) + 1}"
 
-    def test_create_job_initial_status_pending(self, job_manager, sample_task):
-        """New job should have PENDING status."""
-        from app.services.job_manager import JobStatus
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
-
-        assert job.status == JobStatus.PENDING
-
-    def test_create_job_has_task_name(self, job_manager, sample_task):
+    def test_create_job_has_task_name(self, job_with_task):
         """Job should store task name."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert job.task_name == "test_task"
 
-    def test_create_job_has_created_at(self, job_manager, sample_task):
+    def test_create_job_has_created_at(self, job_with_task):
         """Job should have created_at timestamp."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert job.created_at is not None
         assert isinstance(job.created_at, datetime)
 
-    def test_create_job_with_metadata(self, job_manager, sample_task):
+    def test_create_job_with_metadata(self, job_with_task):
         """Job should accept metadata."""
-        job_manager.register_task("test_task", sample_task)
         metadata = {"creator_id": "user123", "content_type": "video"}
-        job = job_manager.create_job("test_task", metadata=metadata)
+        job = job_with_task.create_job("test_task", metadata=metadata)
 
         assert job.metadata == metadata
 
-    def test_create_job_with_empty_metadata(self, job_manager, sample_task):
+    def test_create_job_with_empty_metadata(self, job_with_task):
         """Job should handle empty metadata."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task", metadata={})
+        job = job_with_task.create_job("test_task", metadata={})
 
         assert job.metadata == {}
 
-    def test_create_job_without_metadata(self, job_manager, sample_task):
+    def test_create_job_without_metadata(self, job_with_task):
         """Job should have empty dict for metadata by default."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert job.metadata == {}
 
@@ -153,40 +171,19 @@ class TestJobCreation:
         with pytest.raises(ValueError, match="Unknown task"):
             job_manager.create_job("nonexistent_task")
 
-    def test_create_job_started_at_is_none(self, job_manager, sample_task):
-        """New job should have started_at as None."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
-
-        assert job.started_at is None
-
-    def test_create_job_completed_at_is_none(self, job_manager, sample_task):
-        """New job should have completed_at as None."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
-
-        assert job.completed_at is None
-
-    def test_create_job_result_is_none(self, job_manager, sample_task):
-        """New job should have result as None."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
-
-        assert job.result is None
-
-    def test_create_job_error_is_none(self, job_manager, sample_task):
-        """New job should have error as None."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
-
-        assert job.error is None
-
-    def test_create_job_retry_count_is_zero(self, job_manager, sample_task):
-        """New job should have retry_count as 0."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+    @pytest.mark.parametrize("attr,expected", [
+        ("status", JobStatus.PENDING),
+        ("started_at", None),
+        ("completed_at", None),
+        ("result", None),
+        ("error", None),
+        ("retry_count", 0),
+    ])
+    def test_create_job_initial_attribute(self, job_with_task, attr, expected):
+        """New job should start PENDING with no timestamps, result, error or retries."""
+        job = job_with_task.create_job("test_task")
 
-        assert job.retry_count == 0
+        assert getattr(job, attr) == expected
 
 
 # =============================================================================
@@ -231,12 +228,11 @@ class TestTaskRegistration:
 class TestJobRetrieval:
     """Tests for job retrieval functionality."""
 
-    def test_get_job_by_id(self, job_manager, sample_task):
+    def test_get_job_by_id(self, job_with_task):
         """Should retrieve job by ID."""
-        job_manager.register_task("test_task", sample_task)
-        created_job = job_manager.create_job("test_task")
+        created_job = job_with_task.create_job("test_task")
 
-        retrieved_job = job_manager.get_job(created_job.id)
+        retrieved_job = job_with_task.get_job(created_job.id)
 
         assert retrieved_job == created_job
 
@@ -246,12 +242,11 @@ class TestJobRetrieval:
 
         assert result is None
 
-    def test_get_status_by_id(self, job_manager, sample_task):
+    def test_get_status_by_id(self, job_with_task):
         """Should retrieve job status as dict."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        status = job_manager.get_status(job.id)
+        status = job_with_task.get_status(job.id)
 
         assert status is not None
         assert isinstance(status, dict)
@@ -272,12 +267,11 @@ class TestJobExecution:
     """Tests for job execution functionality."""
 
     @pytest.mark.asyncio
-    async def test_execute_sync_task(self, job_manager, sample_task):
+    async def test_execute_sync_task(self, job_with_task):
         """Should execute synchronous task."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        result = await job_manager.execute(job.id, 5)
+        result = await job_with_task.execute(job.id, 5)
 
         assert result == {"result": 10}
 
@@ -292,27 +286,29 @@ class TestJobExecution:
         assert result == {"result": 10}
 
     @pytest.mark.asyncio
-    async def test_execute_sets_processing_status(self, job_manager):
+    async def test_execute_sets_processing_status(self, job_manager, started):
         """Execution should set PROCESSING status during run."""
         from app.services.job_manager import JobStatus
 
-        status_during_execution = None
-        job_id_holder = {"id": None}
+        release = asyncio.Event()
 
-        async def check_status_task():
-            nonlocal status_during_execution
-            retrieved_job = job_manager.get_job(job_id_holder["id"])
-            status_during_execution = retrieved_job.status
+        async def gated_task():
+            started.set()
+            await release.wait()
             return {"done": True}
 
-        job_manager.register_task("test_task", check_status_task)
+        job_manager.register_task("test_task", gated_task)
         job = job_manager.create_job("test_task")
-        job_id_holder["id"] = job.id
 
-        await job_manager.execute(job.id)
+        task = asyncio.create_task(job_manager.execute(job.id))
+        await started.wait()
+
+        # Verify the status is PROCESSING while the task is running
+        assert job_manager.get_job(job.id).status == JobStatus.PROCESSING
+
+        release.set()
+        await task
 
-        # Verify the status was PROCESSING during execution
-        assert status_during_execution == JobStatus.PROCESSING
         # And now it should be COMPLETED
         assert job.status == JobStatus.COMPLETED
 
@@ -328,34 +324,31 @@ class TestJobExecution:
         assert isinstance(job.started_at, datetime)
 
     @pytest.mark.asyncio
-    async def test_execute_success_sets_completed_status(self, job_manager, sample_task):
+    async def test_execute_success_sets_completed_status(self, job_with_task):
         """Successful execution should set COMPLETED status."""
         from app.services.job_manager import JobStatus
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
         assert job.status == JobStatus.COMPLETED
 
     @pytest.mark.asyncio
-    async def test_execute_success_sets_completed_at(self, job_manager, sample_task):
+    async def test_execute_success_sets_completed_at(self, job_with_task):
         """Successful execution should set completed_at timestamp."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
         assert job.completed_at is not None
         assert isinstance(job.completed_at, datetime)
 
     @pytest.mark.asyncio
-    async def test_execute_success_stores_result(self, job_manager, sample_task):
+    async def test_execute_success_stores_result(self, job_with_task):
         """Successful execution should store result."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 7)
+        await job_with_task.execute(job.id, 7)
 
         assert job.result == {"result": 14}
 
@@ -366,14 +359,14 @@ class TestJobExecution:
             await job_manager.execute("nonexistent-id")
 
     @pytest.mark.asyncio
-    async def test_execute_already_processing_raises_error(self, job_manager, slow_task):
+    async def test_execute_already_processing_raises_error(self, job_manager, slow_task, started):
         """Executing already processing job should raise RuntimeError."""
         job_manager.register_task("test_task", slow_task)
         job = job_manager.create_job("test_task")
 
         # Start execution in background
         task = asyncio.create_task(job_manager.execute(job.id))
-        await asyncio.sleep(0.01)  # Let it start
+        await started.wait()
 
         with pytest.raises(RuntimeError, match="already processing"):
             await job_manager.execute(job.id)
@@ -396,24 +389,20 @@ class TestJobFailure:
     @pytest.mark.asyncio
     async def test_execute_failure_sets_failed_status(self, job_manager, failing_task):
         """Failed execution should set FAILED status."""
-        from app.services.job_manager import JobStatus
         job_manager.register_task("test_task", failing_task)
         job = job_manager.create_job("test_task")
 
-        with pytest.raises(ValueError):
-            await job_manager.execute(job.id)
+        await _run_failing(job_manager, job.id)
 
         assert job.status == JobStatus.FAILED
 
     @pytest.mark.asyncio
     async def test_execute_async_failure_sets_failed_status(self, job_manager, async_failing_task):
         """Failed async execution should set FAILED status."""
-        from app.services.job_manager import JobStatus
         job_manager.register_task("test_task", async_failing_task)
         job = job_manager.create_job("test_task")
 
-        with pytest.raises(ValueError):
-            await job_manager.execute(job.id)
+        await _run_failing(job_manager, job.id)
 
         assert job.status == JobStatus.FAILED
 
@@ -423,8 +412,7 @@ class TestJobFailure:
         job_manager.register_task("test_task", failing_task)
         job = job_manager.create_job("test_task")
 
-        with pytest.raises(ValueError):
-            await job_manager.execute(job.id)
+        await _run_failing(job_manager, job.id)
 
         assert job.error is not None
         assert "Task failed intentionally" in job.error
@@ -435,8 +423,7 @@ class TestJobFailure:
         job_manager.register_task("test_task", failing_task)
         job = job_manager.create_job("test_task")
 
-        with pytest.raises(ValueError):
-            await job_manager.execute(job.id)
+        await _run_failing(job_manager, job.id)
 
         assert job.completed_at is not None
 
@@ -446,8 +433,7 @@ class TestJobFailure:
         job_manager.register_task("test_task", failing_task)
         job = job_manager.create_job("test_task")
 
-        with pytest.raises(ValueError):
-            await job_manager.execute(job.id)
+        await _run_failing(job_manager, job.id)
 
         assert job.can_retry is True
 
@@ -457,8 +443,7 @@ class TestJobFailure:
         job_manager.register_task("test_task", failing_task)
         job = job_manager.create_job("test_task")
 
-        with pytest.raises(ValueError):
-            await job_manager.execute(job.id)
+        await _run_failing(job_manager, job.id)
 
         status = job_manager.get_status(job.id)
 
@@ -494,7 +479,7 @@ class TestRetryMechanism:
 
         # Retry
         await job_manager.retry(job.id)
-        await asyncio.sleep(0.01)  # Allow async task to complete
+        await asyncio.wait_for(job._terminal.wait(), timeout=1.0)
 
         assert job.status.value in ["completed", "processing", "retrying"]
 
@@ -512,6 +497,23 @@ class TestRetryMechanism:
 
         assert job.retry_count == initial_count + 1
 
+    @pytest.mark.asyncio
+    async def test_retry_rearms_terminal_event(self, job_manager, failing_task):
+        """Retry should clear the terminal event until the rerun finishes."""
+        job_manager.register_task("test_task", failing_task)
+        job = job_manager.create_job("test_task")
+
+        with pytest.raises(ValueError):
+            await job_manager.execute(job.id)
+        assert job._terminal.is_set()
+
+        task = await job_manager.retry(job.id)
+        assert not job._terminal.is_set()
+
+        with pytest.raises(ValueError):
+            await task
+        assert job._terminal.is_set()
+
     @pytest.mark.asyncio
     async def test_retry_sets_retrying_status(self, job_manager, failing_task):
         """Retry should set RETRYING status initially."""
@@ -555,24 +557,22 @@ class TestRetryMechanism:
             pass
 
     @pytest.mark.asyncio
-    async def test_cannot_retry_pending_job(self, job_manager, sample_task):
+    async def test_cannot_retry_pending_job(self, job_with_task):
         """Cannot retry a pending job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        result = await job_manager.retry(job.id)
+        result = await job_with_task.retry(job.id)
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_cannot_retry_completed_job(self, job_manager, sample_task):
+    async def test_cannot_retry_completed_job(self, job_with_task):
         """Cannot retry a completed job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
-        result = await job_manager.retry(job.id)
+        result = await job_with_task.retry(job.id)
 
         assert result is None
 
@@ -616,13 +616,13 @@ class TestJobEnqueue:
 
     @pytest.mark.asyncio
     async def test_enqueue_returns_task(self, job_manager, sample_async_task):
-        """Enqueue should return asyncio.Task."""
+        """Enqueue should return an awaitable asyncio.Future."""
         job_manager.register_task("test_task", sample_async_task)
         job = job_manager.create_job("test_task")
 
         task = await job_manager.enqueue(job.id, 5)
 
-        assert isinstance(task, asyncio.Task)
+        assert isinstance(task, asyncio.Future)
 
         # Cleanup
         await task
@@ -642,6 +642,107 @@ class TestJobEnqueue:
         result = await task
         assert result == {"result": 10}
 
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self):
+        """A single-worker pool should run enqueued jobs one at a time."""
+        from app.services.job_manager import JobManager
+        manager = JobManager(max_workers=1)
+        running = 0
+        peak = 0
+
+        async def task():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        manager.register_task("test_task", task)
+        jobs = [manager.create_job("test_task") for _ in range(3)]
+        futures = [await manager.enqueue(job.id) for job in jobs]
+        await asyncio.gather(*futures)
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_job_does_not_hold_back_queued_jobs(self):
+        """Jobs queued behind a slow one should go to the other idle workers."""
+        from app.services.job_manager import JobManager
+        manager = JobManager(max_workers=4)
+        gate = asyncio.Event()
+
+        async def blocked():
+            await gate.wait()
+
+        async def fast():
+            return "done"
+
+        manager.register_task("blocked", blocked)
+        manager.register_task("fast", fast)
+        slow = await manager.enqueue(manager.create_job("blocked").id)
+        # Queue the rest before any worker wakes, so the backlog is deep
+        futures = [await manager.enqueue(manager.create_job("fast").id) for _ in range(11)]
+
+        results = await asyncio.wait_for(asyncio.gather(*futures), timeout=1.0)
+
+        assert results == ["done"] * 11
+        assert not slow.done()
+        gate.set()
+        await slow
+
+    @pytest.mark.asyncio
+    async def test_enqueue_waits_when_queue_full(self, slow_task, started):
+        """Enqueue should only suspend once max_queued jobs are waiting."""
+        from app.services.job_manager import JobManager
+        manager = JobManager(max_workers=1, max_queued=1)
+        manager.register_task("slow", slow_task)
+        jobs = [manager.create_job("slow") for _ in range(3)]
+
+        await manager.enqueue(jobs[0].id)
+        await started.wait()  # the single worker is now busy
+        await manager.enqueue(jobs[1].id)  # fills the queue
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(manager.enqueue(jobs[2].id), timeout=0.01)
+
+        manager.reset()
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_job_cancellation(self, slow_task, sample_task, started):
+        """Cancelling a running job should leave its worker serving the queue."""
+        from app.services.job_manager import JobManager
+        manager = JobManager(max_workers=1)
+        manager.register_task("slow", slow_task)
+        manager.register_task("fast", sample_task)
+
+        slow = manager.create_job("slow")
+        await manager.enqueue(slow.id)
+        await started.wait()
+        manager.cancel(slow.id)
+
+        fast = manager.create_job("fast")
+        result = await asyncio.wait_for(await manager.enqueue(fast.id, 2), timeout=1.0)
+
+        assert result == {"result": 4}
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_workers(self, slow_task, started):
+        """aclose should cancel running and queued jobs and stop the workers."""
+        from app.services.job_manager import JobManager
+        manager = JobManager(max_workers=1)
+        manager.register_task("slow", slow_task)
+
+        running = await manager.enqueue(manager.create_job("slow").id)
+        await started.wait()
+        queued = await manager.enqueue(manager.create_job("slow").id)
+        workers = list(manager._workers)
+
+        await manager.aclose()
+
+        assert running.cancelled() and queued.cancelled()
+        assert all(w.done() for w in workers)
+        assert manager._workers == []
+
 
 # =============================================================================
 # Job Cancellation Tests
@@ -651,44 +752,44 @@ class TestJobCancellation:
     """Tests for job cancellation functionality."""
 
     @pytest.mark.asyncio
-    async def test_cancel_running_job(self, job_manager, slow_task):
+    async def test_cancel_running_job(self, job_manager, slow_task, started):
         """Should be able to cancel a running job."""
         job_manager.register_task("test_task", slow_task)
         job = job_manager.create_job("test_task")
 
         task = await job_manager.enqueue(job.id)
-        await asyncio.sleep(0.01)  # Let it start
+        await started.wait()
 
         result = job_manager.cancel(job.id)
 
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_cancel_sets_failed_status(self, job_manager, slow_task):
+    async def test_cancel_sets_failed_status(self, job_manager, slow_task, started):
         """Cancelled job should have FAILED status."""
         from app.services.job_manager import JobStatus
         job_manager.register_task("test_task", slow_task)
         job = job_manager.create_job("test_task")
 
         task = await job_manager.enqueue(job.id)
-        await asyncio.sleep(0.01)
+        await started.wait()
 
         job_manager.cancel(job.id)
-        await asyncio.sleep(0.01)  # Let cancellation propagate
+        await asyncio.wait_for(job._terminal.wait(), timeout=1.0)
 
         assert job.status == JobStatus.FAILED
 
     @pytest.mark.asyncio
-    async def test_cancel_sets_cancelled_error(self, job_manager, slow_task):
+    async def test_cancel_sets_cancelled_error(self, job_manager, slow_task, started):
         """Cancelled job should have cancellation error message."""
         job_manager.register_task("test_task", slow_task)
         job = job_manager.create_job("test_task")
 
         task = await job_manager.enqueue(job.id)
-        await asyncio.sleep(0.01)
+        await started.wait()
 
         job_manager.cancel(job.id)
-        await asyncio.sleep(0.01)
+        await asyncio.wait_for(job._terminal.wait(), timeout=1.0)
 
         assert "Cancelled" in job.error
 
@@ -698,12 +799,11 @@ class TestJobCancellation:
 
         assert result is False
 
-    def test_cancel_not_running_job(self, job_manager, sample_task):
+    def test_cancel_not_running_job(self, job_with_task):
         """Cancelling non-running job should return False."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        result = job_manager.cancel(job.id)
+        result = job_with_task.cancel(job.id)
 
         assert result is False
 
@@ -715,108 +815,123 @@ class TestJobCancellation:
 class TestJobStatusDict:
     """Tests for job to_dict serialization - AC-2."""
 
-    def test_to_dict_includes_id(self, job_manager, sample_task):
+    def test_to_dict_includes_id(self, job_with_task):
         """Job dict should include id."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "id" in result
         assert result["id"] == job.id
 
-    def test_to_dict_includes_task_name(self, job_manager, sample_task):
+    def test_to_dict_includes_task_name(self, job_with_task):
         """Job dict should include task_name."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "task_name" in result
         assert result["task_name"] == "test_task"
 
-    def test_to_dict_includes_status(self, job_manager, sample_task):
+    def test_to_dict_includes_status(self, job_with_task):
         """Job dict should include status as string."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "status" in result
         assert result["status"] == "pending"
 
-    def test_to_dict_includes_created_at(self, job_manager, sample_task):
+    def test_to_dict_includes_created_at(self, job_with_task):
         """Job dict should include created_at as ISO string."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "created_at" in result
         assert isinstance(result["created_at"], str)
 
-    def test_to_dict_includes_started_at_null(self, job_manager, sample_task):
+    def test_to_dict_includes_started_at_null(self, job_with_task):
         """Job dict should include started_at as null for pending."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "started_at" in result
         assert result["started_at"] is None
 
-    def test_to_dict_includes_completed_at_null(self, job_manager, sample_task):
+    def test_to_dict_includes_completed_at_null(self, job_with_task):
         """Job dict should include completed_at as null for pending."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "completed_at" in result
         assert result["completed_at"] is None
 
-    def test_to_dict_includes_result(self, job_manager, sample_task):
+    @pytest.mark.asyncio
+    async def test_to_dict_timestamps_after_execution(self, job_with_task):
+        """Job dict should carry ISO timestamps once the job has run."""
+        job = job_with_task.create_job("test_task")
+
+        await job_with_task.execute(job.id, 1)
+        result = job.to_dict()
+
+        assert result["status"] == "completed"
+        assert result["started_at"] == job.started_at.isoformat()
+        assert result["completed_at"] == job.completed_at.isoformat()
+
+    def test_to_dict_timestamps_follow_assignment(self, job_with_task):
+        """Job dict should serialize timestamps from their current values."""
+        from datetime import datetime
+        job = job_with_task.create_job("test_task")
+        job.to_dict()
+
+        job.created_at = datetime(2024, 1, 2, 3, 4, 5)
+        job.started_at = datetime(2024, 1, 2, 3, 4, 6)
+
+        result = job.to_dict()
+        assert result["created_at"] == "2024-01-02T03:04:05"
+        assert result["started_at"] == "2024-01-02T03:04:06"
+        assert result["completed_at"] is None
+
+    def test_to_dict_includes_result(self, job_with_task):
         """Job dict should include result."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "result" in result
 
-    def test_to_dict_includes_error(self, job_manager, sample_task):
+    def test_to_dict_includes_error(self, job_with_task):
         """Job dict should include error."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "error" in result
 
-    def test_to_dict_includes_retry_count(self, job_manager, sample_task):
+    def test_to_dict_includes_retry_count(self, job_with_task):
         """Job dict should include retry_count."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "retry_count" in result
         assert result["retry_count"] == 0
 
-    def test_to_dict_includes_can_retry(self, job_manager, sample_task):
+    def test_to_dict_includes_can_retry(self, job_with_task):
         """Job dict should include can_retry."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         result = job.to_dict()
 
         assert "can_retry" in result
 
-    def test_to_dict_includes_metadata(self, job_manager, sample_task):
+    def test_to_dict_includes_metadata(self, job_with_task):
         """Job dict should include metadata."""
-        job_manager.register_task("test_task", sample_task)
         metadata = {"key": "value"}
-        job = job_manager.create_job("test_task", metadata=metadata)
+        job = job_with_task.create_job("test_task", metadata=metadata)
 
         result = job.to_dict()
 
@@ -831,20 +946,18 @@ class TestJobStatusDict:
 class TestJobProperties:
     """Tests for Job properties."""
 
-    def test_can_retry_false_when_pending(self, job_manager, sample_task):
+    def test_can_retry_false_when_pending(self, job_with_task):
         """can_retry should be False for pending job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert job.can_retry is False
 
     @pytest.mark.asyncio
-    async def test_can_retry_false_when_completed(self, job_manager, sample_task):
+    async def test_can_retry_false_when_completed(self, job_with_task):
         """can_retry should be False for completed job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
         assert job.can_retry is False
 
@@ -859,20 +972,37 @@ class TestJobProperties:
 
         assert job.can_retry is True
 
-    def test_is_terminal_false_when_pending(self, job_manager, sample_task):
+    def test_job_is_slotted(self, job_with_task):
+        """Job should use __slots__ and reject undeclared attributes."""
+        job = job_with_task.create_job("test_task")
+
+        assert not hasattr(job, "__dict__")
+        with pytest.raises(AttributeError):
+            job.undeclared = True
+
+    def test_status_is_read_only(self, job_with_task):
+        """status should only change through the manager, keeping counts in step."""
+        from app.services.job_manager import JobStatus
+        job = job_with_task.create_job("test_task")
+
+        with pytest.raises(AttributeError):
+            job.status = JobStatus.COMPLETED
+
+        assert job.status == JobStatus.PENDING
+        assert job_with_task.pending_count == 1
+
+    def test_is_terminal_false_when_pending(self, job_with_task):
         """is_terminal should be False for pending job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert job.is_terminal is False
 
     @pytest.mark.asyncio
-    async def test_is_terminal_true_when_completed(self, job_manager, sample_task):
+    async def test_is_terminal_true_when_completed(self, job_with_task):
         """is_terminal should be True for completed job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
         assert job.is_terminal is True
 
@@ -899,32 +1029,81 @@ class TestJobManagerCounts:
         """pending_count should be 0 initially."""
         assert job_manager.pending_count == 0
 
-    def test_pending_count_increases_with_jobs(self, job_manager, sample_task):
+    def test_pending_count_increases_with_jobs(self, job_with_task):
         """pending_count should increase as jobs are created."""
-        job_manager.register_task("test_task", sample_task)
 
-        job_manager.create_job("test_task")
-        assert job_manager.pending_count == 1
+        job_with_task.create_job("test_task")
+        assert job_with_task.pending_count == 1
 
-        job_manager.create_job("test_task")
-        assert job_manager.pending_count == 2
+        job_with_task.create_job("test_task")
+        assert job_with_task.pending_count == 2
 
     @pytest.mark.asyncio
-    async def test_pending_count_decreases_after_execution(self, job_manager, sample_task):
+    async def test_pending_count_decreases_after_execution(self, job_with_task):
         """pending_count should decrease after job execution."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        assert job_manager.pending_count == 1
+        assert job_with_task.pending_count == 1
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
-        assert job_manager.pending_count == 0
+        assert job_with_task.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_evicted_oldest_first(self, sample_task):
+        """Beyond max_jobs, the least recently finished jobs are dropped."""
+        from app.services.job_manager import JobManager
+        manager = JobManager(max_jobs=2)
+        manager.register_task("test_task", sample_task)
+        pending = manager.create_job("test_task")
+        done = [manager.create_job("test_task") for _ in range(3)]
+
+        for job in done:
+            await manager.execute(job.id, 1)
+
+        assert manager.get_job(pending.id) is pending
+        assert manager.get_job(done[0].id) is None
+        assert manager.get_job(done[1].id) is None
+        assert manager.get_job(done[2].id) is done[2]
+        assert manager.list_by_status(JobStatus.COMPLETED) == [done[2]]
 
     def test_processing_count_zero_initially(self, job_manager):
         """processing_count should be 0 initially."""
         assert job_manager.processing_count == 0
 
+    @pytest.mark.asyncio
+    async def test_list_by_status(self, job_with_task):
+        """list_by_status should return only the jobs in that status."""
+        done = job_with_task.create_job("test_task")
+        waiting = job_with_task.create_job("test_task")
+
+        await job_with_task.execute(done.id, 1)
+
+        assert job_with_task.list_by_status(JobStatus.COMPLETED) == [done]
+        assert job_with_task.list_by_status(JobStatus.PENDING) == [waiting]
+        assert job_with_task.list_by_status(JobStatus.FAILED) == []
+
+    @pytest.mark.asyncio
+    async def test_counts_track_status_transitions(self, job_manager, started):
+        """Counts should follow a job from PENDING through PROCESSING."""
+        release = asyncio.Event()
+
+        async def gated_task():
+            started.set()
+            await release.wait()
+
+        job_manager.register_task("test_task", gated_task)
+        job = job_manager.create_job("test_task")
+        task = asyncio.create_task(job_manager.execute(job.id))
+        await started.wait()
+
+        assert (job_manager.pending_count, job_manager.processing_count) == (0, 1)
+
+        release.set()
+        await task
+
+        assert (job_manager.pending_count, job_manager.processing_count) == (0, 0)
+
 
 # =============================================================================
 # Concurrent Jobs Tests
@@ -1008,24 +1187,22 @@ class TestConcurrentJobs:
 class TestJobStatusEndpoint:
     """Tests for job status endpoint behavior - AC-2."""
 
-    def test_status_returns_pending_for_new_job(self, job_manager, sample_task):
+    def test_status_returns_pending_for_new_job(self, job_with_task):
         """Status should return 'pending' for new job."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        status = job_manager.get_status(job.id)
+        status = job_with_task.get_status(job.id)
 
         assert status["status"] == "pending"
 
     @pytest.mark.asyncio
-    async def test_status_returns_completed_after_execution(self, job_manager, sample_task):
+    async def test_status_returns_completed_after_execution(self, job_with_task):
         """Status should return 'completed' after execution."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
-        status = job_manager.get_status(job.id)
+        status = job_with_task.get_status(job.id)
 
         assert status["status"] == "completed"
 
@@ -1056,8 +1233,7 @@ class TestIngestionTasksIntegration:
         from app.tasks import ingestion_tasks
         from app.services.job_manager import job_manager
 
-        assert "content_ingestion" in job_manager._tasks
-        assert "file_upload" in job_manager._tasks
+        assert {"content_ingestion", "file_upload"} <= job_manager._task_names
 
     @pytest.mark.asyncio
     async def test_content_ingestion_task_executes(self):
@@ -1122,22 +1298,20 @@ class TestIngestionTasksIntegration:
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    def test_job_with_none_metadata(self, job_manager, sample_task):
+    def test_job_with_none_metadata(self, job_with_task):
         """Job should handle None metadata gracefully."""
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task", metadata=None)
+        job = job_with_task.create_job("test_task", metadata=None)
 
         assert job.metadata == {}
 
-    def test_job_with_complex_metadata(self, job_manager, sample_task):
+    def test_job_with_complex_metadata(self, job_with_task):
         """Job should handle complex metadata."""
-        job_manager.register_task("test_task", sample_task)
         metadata = {
             "nested": {"key": "value"},
             "list": [1, 2, 3],
             "mixed": {"items": [{"a": 1}, {"b": 2}]}
         }
-        job = job_manager.create_job("test_task", metadata=metadata)
+        job = job_with_task.create_job("test_task", metadata=metadata)
 
         assert job.metadata == metadata
 
@@ -1169,11 +1343,10 @@ class TestEdgeCases:
         assert result == {"name": "test", "value": 42}
 
     @pytest.mark.asyncio
-    async def test_rapid_job_creation(self, job_manager, sample_task):
+    async def test_rapid_job_creation(self, job_with_task):
         """Should handle rapid job creation without collisions."""
-        job_manager.register_task("test_task", sample_task)
 
-        jobs = [job_manager.create_job("test_task") for _ in range(100)]
+        jobs = [job_with_task.create_job("test_task") for _ in range(100)]
 
         # All IDs should be unique
         ids = [job.id for job in jobs]
@@ -1189,6 +1362,13 @@ class TestEdgeCases:
         with pytest.raises(ValueError):
             job_manager.create_job("   ")
 
+    def test_registered_blank_task_name_still_rejected(self, job_manager, sample_task):
+        """A blank name should be rejected even if a task was registered under it."""
+        job_manager.register_task("   ", sample_task)
+
+        with pytest.raises(ValueError):
+            job_manager.create_job("   ")
+
 
 # =============================================================================
 # Logging Tests
@@ -1198,39 +1378,36 @@ class TestLogging:
     """Tests for logging behavior."""
 
     @pytest.mark.asyncio
-    async def test_job_creation_is_logged(self, job_manager, sample_task, caplog):
+    async def test_job_creation_is_logged(self, job_with_task, caplog):
         """Job creation should be logged."""
         import logging
         caplog.set_level(logging.INFO)
 
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
         assert f"Created job {job.id}" in caplog.text
 
     @pytest.mark.asyncio
-    async def test_job_execution_start_is_logged(self, job_manager, sample_task, caplog):
+    async def test_job_execution_start_is_logged(self, job_with_task, caplog):
         """Job execution start should be logged."""
         import logging
         caplog.set_level(logging.INFO)
 
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
         assert f"Starting job {job.id}" in caplog.text
 
     @pytest.mark.asyncio
-    async def test_job_completion_is_logged(self, job_manager, sample_task, caplog):
+    async def test_job_completion_is_logged(self, job_with_task, caplog):
         """Job completion should be logged."""
         import logging
         caplog.set_level(logging.INFO)
 
-        job_manager.register_task("test_task", sample_task)
-        job = job_manager.create_job("test_task")
+        job = job_with_task.create_job("test_task")
 
-        await job_manager.execute(job.id, 1)
+        await job_with_task.execute(job.id, 1)
 
         assert f"Job {job.id} completed" in caplog.text
 
@@ -1247,3 +1424,15 @@ class TestLogging:
             await job_manager.execute(job.id)
 
         assert f"Job {job.id} failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_records_are_logged_at_call_site(self, job_with_task, caplog):
+        """Records should be written immediately, one per job, by the emitting method."""
+        import logging
+        caplog.set_level(logging.INFO)
+
+        jobs = [job_with_task.create_job("test_task") for _ in range(3)]
+
+        created = [r for r in caplog.records if r.msg.startswith("Created job")]
+        assert [r.args[0] for r in created] == [job.id for job in jobs]
+        assert all(r.funcName == "create_job" for r in created)
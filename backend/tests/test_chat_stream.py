@@ -13,81 +13,222 @@ NOTE: These tests are designed to FAIL initially because the /chat/stream
 endpoint does not exist yet. They define the expected behavior for TDD.
 """
 
-import json
+import asyncio
+import orjson
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock, PropertyMock
-from typing import AsyncIterator, List, Dict, Any
-from contextlib import contextmanager
+from typing import AsyncIterator, List, Dict, Any, NamedTuple, Optional
+from dataclasses import dataclass
+from functools import lru_cache
 
-from tests.mocks.supabase_mock import MockDatabase
+from fastapi import BackgroundTasks
+
+from app.services.cache import CacheService, MemoryCache
+from app.services.semantic_cache import SemanticCache
+from main import STREAM_TOKENS_PER_FRAME, get_db, get_response_cache, stream_chat_generator
 
 
 # =============================================================================
-# Mock Setup Helper
+# Mock Setup Fixture
 # =============================================================================
 
-@contextmanager
-def mock_stream_dependencies(response_text="Hello world this is a test response"):
-    """Context manager to mock support_agent and database for streaming tests."""
-    mock_db = MockDatabase()
+@pytest.fixture
+def stream_deps(monkeypatch, app, mock_db):
+    """Mock support_agent and database for streaming tests."""
     mock_response = {
-        "response": response_text,
+        "response": "Hello world this is a test response",
         "sources": ["Module 1 - Introduction (Score: 0.92)", "Module 2 - Advanced (Score: 0.85)"],
         "should_escalate": False,
         "context_used": 2
     }
 
-    with patch('main.support_agent.process_query', new_callable=AsyncMock) as mock_process:
-        mock_process.return_value = mock_response
-        with patch('main.db', mock_db):
-            yield mock_process, mock_db, mock_response
+    async def fake_process_query(**kwargs):
+        return mock_response
+
+    monkeypatch.setattr('main.support_agent.process_query', fake_process_query)
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: mock_db)
+    # A fresh cache per test so one test's answer is never replayed in another
+    cache = SemanticCache(CacheService(MemoryCache()))
+    monkeypatch.setitem(app.dependency_overrides, get_response_cache, lambda: cache)
+    yield fake_process_query, mock_db, mock_response
 
 
 # =============================================================================
 # Mock Streaming Response Helpers
 # =============================================================================
 
+@dataclass(slots=True)
+class _Delta:
+    content: Optional[str]
+
+
+@dataclass(slots=True)
+class _Choice:
+    delta: _Delta
+    finish_reason: Optional[str] = None
+
+
 class MockStreamingChunk:
     """Mock chunk object matching OpenAI streaming response structure."""
 
-    def __init__(self, content: str, finish_reason: str = None):
-        self.choices = [MagicMock()]
-        self.choices[0].delta = MagicMock()
-        self.choices[0].delta.content = content
-        self.choices[0].finish_reason = finish_reason
+    __slots__ = ("choices",)
 
+    def __init__(self, content: Optional[str], finish_reason: Optional[str] = None):
+        self.choices = [_Choice(_Delta(content), finish_reason)]
 
-async def mock_streaming_response(tokens: List[str]) -> AsyncIterator[MockStreamingChunk]:
-    """Generate mock streaming chunks for testing."""
-    for token in tokens:
-        yield MockStreamingChunk(content=token)
-    # Final chunk with finish_reason
-    yield MockStreamingChunk(content=None, finish_reason="stop")
-
-
-def parse_sse_events(response_text: str) -> List[Dict[str, Any]]:
-    """Parse SSE formatted response into list of event data."""
-    events = []
-    current_data = ""
-
-    for line in response_text.split("\n"):
-        if line.startswith("data: "):
-            current_data = line[6:]  # Remove "data: " prefix
-        elif line == "" and current_data:
-            try:
-                events.append(json.loads(current_data))
-            except json.JSONDecodeError:
-                pass  # Skip non-JSON data lines
-            current_data = ""
-
-    # Handle last event if no trailing newline
-    if current_data:
+
+class _AIter:
+    """Async iterator over pre-built items that never awaits between them."""
+
+    __slots__ = ("_it",)
+
+    def __init__(self, items: List[Any]):
+        self._it = iter(items)
+
+    def __aiter__(self) -> "_AIter":
+        return self
+
+    async def __anext__(self) -> Any:
         try:
-            events.append(json.loads(current_data))
-        except json.JSONDecodeError:
-            pass
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
 
-    return events
+
+def mock_streaming_response(tokens: List[str]) -> AsyncIterator[MockStreamingChunk]:
+    """Generate mock streaming chunks for testing."""
+    chunks = [MockStreamingChunk(content=token) for token in tokens]
+    # Final chunk with finish_reason
+    chunks.append(MockStreamingChunk(content=None, finish_reason="stop"))
+    return _AIter(chunks)
+
+
+class ParsedStream(NamedTuple):
+    """SSE events from one response, bucketed by type during the parse."""
+    tokens: List[Dict[str, Any]]
+    done: Optional[Dict[str, Any]]
+    errors: List[Dict[str, Any]]
+    all: List[Dict[str, Any]]
+
+
+def parse_sse_events(response_content: bytes) -> ParsedStream:
+    """
+    Parse an SSE response body in one linear scan, dispatching each event
+    into its type bucket. The done event must be the last and only one.
+    """
+    tokens, errors, events = [], [], []
+    done = None
+    # Slice payloads as zero-copy views; orjson decodes them without a bytes copy
+    view = memoryview(response_content)
+    i, n = 0, len(response_content)
+    while i < n:
+        # Each event ends with a blank line; tolerate a missing final one
+        j = response_content.find(b"\n\n", i)
+        if j < 0:
+            j = n
+        if response_content.startswith(b"data: ", i):
+            assert done is None, "No event may follow the done event"
+            event = orjson.loads(view[i + 6:j])
+            events.append(event)
+            event_type = event.get("type")
+            if event_type == "token":
+                tokens.append(event)
+            elif event_type == "done":
+                done = event
+            elif event_type == "error":
+                errors.append(event)
+        i = j + 2
+    return ParsedStream(tokens, done, errors, events)
+
+
+@lru_cache(maxsize=None)
+def expected_sse_body(
+    response_text: str,
+    sources: tuple,
+    should_escalate: bool,
+    conversation_id: str
+) -> bytes:
+    """
+    Build the exact SSE bytes /chat/stream should emit for a mock response.
+
+    Frames are encoded once per distinct response and reused by every test
+    that asks for the same one.
+    """
+    frames = []
+    words = response_text.split(" ") if response_text else []
+    for i in range(0, len(words), STREAM_TOKENS_PER_FRAME):
+        chunk = " ".join(words[i:i + STREAM_TOKENS_PER_FRAME])
+        token = {"type": "token", "content": chunk if i == 0 else " " + chunk}
+        frames.append(b"data: " + orjson.dumps(token) + b"\n\n")
+    done = {
+        "type": "done",
+        "sources": list(sources),
+        "should_escalate": should_escalate,
+        "conversation_id": conversation_id
+    }
+    frames.append(b"data: " + orjson.dumps(done) + b"\n\n")
+    return b"".join(frames)
+
+
+class StreamResult(NamedTuple):
+    """Status, headers and raw body bytes collected from one ASGI request."""
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+
+
+async def stream_collect(app, path: str, json: Dict[str, Any]) -> StreamResult:
+    """
+    POST a JSON body straight into the ASGI app and collect the raw response.
+
+    Skips the HTTP client layer entirely: body chunks are kept as the bytes
+    the app sent and joined once at the end.
+    """
+    body = orjson.dumps(json)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"test"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("test", 80),
+    }
+    request_sent = False
+    response_done = asyncio.Event()
+    status_code = 0
+    headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Only report a disconnect once the app has finished responding
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            headers.update((k.decode("latin-1"), v.decode("latin-1")) for k, v in message["headers"])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(scope, receive, send)
+    return StreamResult(status_code, headers, b"".join(chunks))
 
 
 # =============================================================================
@@ -121,42 +262,56 @@ def mock_streaming_escalate_response():
 class TestStreamContentType:
     """Tests for SSE content-type header - AC-1."""
 
-    def test_stream_returns_event_stream_content_type(self, client):
+    async def test_stream_returns_event_stream_content_type(self, app, stream_deps):
         """
         AC-1: POST /chat/stream should return content-type text/event-stream.
 
         This test will FAIL because the /chat/stream endpoint does not exist.
         Expected failure: 404 Not Found (endpoint doesn't exist yet)
         """
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "What is Python?",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "What is Python?",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            # Should return 200 with streaming content type
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}. Endpoint /chat/stream may not exist."
-            content_type = response.headers.get("content-type", "")
-            assert "text/event-stream" in content_type, f"Expected text/event-stream, got {content_type}"
+        # Should return 200 with streaming content type
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}. Endpoint /chat/stream may not exist."
+        content_type = response.headers.get("content-type", "")
+        assert "text/event-stream" in content_type, f"Expected text/event-stream, got {content_type}"
 
-    def test_stream_returns_correct_charset(self, client):
+    async def test_stream_returns_correct_charset(self, app, stream_deps):
         """Stream response should include charset=utf-8 in content-type."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Test question",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Test question",
+                "creator_id": "test-creator-123"
+            }
+        )
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        content_type = response.headers.get("content-type", "")
+        # Should include charset for proper encoding
+        assert "utf-8" in content_type.lower() or "text/event-stream" in content_type
+
+    async def test_stream_disables_proxy_buffering(self, app, stream_deps):
+        """Stream should tell caches and proxies not to buffer the events."""
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Test question",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            content_type = response.headers.get("content-type", "")
-            # Should include charset for proper encoding
-            assert "utf-8" in content_type.lower() or "text/event-stream" in content_type
+        assert response.headers.get("cache-control") == "no-cache"
+        assert response.headers.get("x-accel-buffering") == "no"
 
 
 # =============================================================================
@@ -166,100 +321,98 @@ class TestStreamContentType:
 class TestStreamTokenEvents:
     """Tests for token streaming - AC-2."""
 
-    def test_stream_returns_multiple_sse_events(self, client):
+    async def test_stream_returns_multiple_sse_events(self, app, stream_deps):
         """
         AC-2: Stream should return multiple SSE events for tokens.
 
         This test will FAIL because the /chat/stream endpoint does not exist.
         """
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Say hello world",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Say hello world",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            # Should have at least 2 events (tokens + done)
-            assert len(events) >= 2, f"Expected at least 2 events, got {len(events)}"
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
+        # Should have at least 2 events (tokens + done)
+        assert len(parsed.all) >= 2, f"Expected at least 2 events, got {len(parsed.all)}"
 
-    def test_stream_each_event_is_valid_json(self, client):
+    async def test_stream_each_event_is_valid_json(self, app, stream_deps):
         """Each SSE event should contain valid JSON data."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Test",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Test",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            assert len(events) > 0, "Expected at least one event"
-            for event in events:
-                assert isinstance(event, dict), f"Event should be dict, got {type(event)}"
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
+        assert len(parsed.all) > 0, "Expected at least one event"
+        for event in parsed.all:
+            assert isinstance(event, dict), f"Event should be dict, got {type(event)}"
 
-    def test_stream_events_have_type_field(self, client):
+    async def test_stream_events_have_type_field(self, app, stream_deps):
         """Each SSE event should have a 'type' field."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Hello",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Hello",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            assert len(events) > 0, "Expected at least one event"
-            for event in events:
-                assert "type" in event, f"Event missing 'type' field: {event}"
-                assert event["type"] in ["token", "done", "error"], f"Invalid type: {event['type']}"
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
+        assert len(parsed.all) > 0, "Expected at least one event"
+        for event in parsed.all:
+            assert "type" in event, f"Event missing 'type' field: {event}"
+            assert event["type"] in ["token", "done", "error"], f"Invalid type: {event['type']}"
 
-    def test_stream_token_events_have_content_field(self, client):
+    async def test_stream_token_events_have_content_field(self, app, stream_deps):
         """Token events should have a 'content' field with the token text."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Greet me",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Greet me",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            token_events = [e for e in events if e.get("type") == "token"]
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
 
-            # Should have at least one token event (unless empty response)
-            for event in token_events:
-                assert "content" in event, f"Token event missing 'content': {event}"
-                assert isinstance(event["content"], str), f"Content should be string"
+        # Should have at least one token event (unless empty response)
+        for event in parsed.tokens:
+            assert "content" in event, f"Token event missing 'content': {event}"
+            assert isinstance(event["content"], str), f"Content should be string"
 
-    def test_stream_preserves_token_order(self, client):
+    async def test_stream_preserves_token_order(self, app, stream_deps):
         """Tokens should be received in the order they were generated."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Count to three",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Count to three",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            token_events = [e for e in events if e.get("type") == "token"]
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
 
-            # Verify we can reconstruct content from tokens
-            if len(token_events) > 0:
-                received_content = "".join([e.get("content", "") for e in token_events])
-                assert len(received_content) > 0, "Should have some content from tokens"
+        # Verify we can reconstruct content from tokens
+        if len(parsed.tokens) > 0:
+            received_content = "".join([e.get("content", "") for e in parsed.tokens])
+            assert len(received_content) > 0, "Should have some content from tokens"
 
 
 # =============================================================================
@@ -269,85 +422,48 @@ class TestStreamTokenEvents:
 class TestStreamFinalEvent:
     """Tests for final event with metadata - AC-3."""
 
-    def test_stream_final_event_has_done_type(self, client):
+    async def test_stream_final_event_has_done_type(self, app, stream_deps):
         """
         AC-3: Final event should have type 'done'.
 
         This test will FAIL because the /chat/stream endpoint does not exist.
         """
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Question",
-                    "creator_id": "test-creator-123"
-                }
-            )
-
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
-
-            assert len(done_events) == 1, f"Expected exactly 1 done event, got {len(done_events)}"
-
-    def test_stream_final_event_includes_sources(self, client):
-        """Final 'done' event should include sources list."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "What is Python?",
-                    "creator_id": "test-creator-123"
-                }
-            )
-
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
-
-            assert len(done_events) == 1, f"Expected exactly 1 done event"
-            done_event = done_events[0]
-            assert "sources" in done_event, f"Done event missing 'sources': {done_event}"
-            assert isinstance(done_event["sources"], list), "Sources should be a list"
-
-    def test_stream_final_event_includes_should_escalate(self, client):
-        """Final 'done' event should include should_escalate boolean."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Question",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Question",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
 
-            assert len(done_events) == 1, f"Expected exactly 1 done event"
-            done_event = done_events[0]
-            assert "should_escalate" in done_event, f"Done event missing 'should_escalate': {done_event}"
-            assert isinstance(done_event["should_escalate"], bool), "should_escalate should be bool"
+        # The parser rejects anything after done, so one done event means exactly one
+        assert parsed.done is not None, "Expected exactly 1 done event, got none"
+        assert parsed.all[-1] is parsed.done
 
-    def test_stream_final_event_includes_conversation_id(self, client):
-        """Final 'done' event should include conversation_id."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Question",
-                    "creator_id": "test-creator-123"
-                }
-            )
+    async def test_stream_final_event_includes_metadata(self, app, stream_deps):
+        """Final 'done' event should include sources, should_escalate and conversation_id."""
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "What is Python?",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        done_event = parse_sse_events(response.content).done
 
-            assert len(done_events) == 1, f"Expected exactly 1 done event"
-            done_event = done_events[0]
-            assert "conversation_id" in done_event, f"Done event missing 'conversation_id': {done_event}"
+        assert done_event is not None, f"Expected exactly 1 done event"
+        assert "sources" in done_event, f"Done event missing 'sources': {done_event}"
+        assert isinstance(done_event["sources"], list), "Sources should be a list"
+        assert "should_escalate" in done_event, f"Done event missing 'should_escalate': {done_event}"
+        assert isinstance(done_event["should_escalate"], bool), "should_escalate should be bool"
+        assert "conversation_id" in done_event, f"Done event missing 'conversation_id': {done_event}"
 
 
 # =============================================================================
@@ -357,45 +473,23 @@ class TestStreamFinalEvent:
 class TestStreamValidation:
     """Tests for stream request validation."""
 
-    def test_stream_missing_message_returns_422(self, client):
-        """Stream should return 422 when message is missing."""
-        response = client.post(
-            "/chat/stream",
-            json={
-                "creator_id": "test-creator-123"
-            }
-        )
+    @pytest.mark.parametrize("payload", [
+        pytest.param({"creator_id": "test-creator-123"}, id="missing_message"),
+        pytest.param({}, id="empty_body"),
+        pytest.param({"message": None, "creator_id": "test-creator-123"}, id="null_message"),
+    ])
+    async def test_stream_invalid_message_returns_422(self, app, payload):
+        """Stream should return 422 when message is missing, null or the body is empty."""
+        response = await stream_collect(app, "/chat/stream", json=payload)
 
         # First check endpoint exists (not 404), then check validation
         assert response.status_code != 404, "Endpoint /chat/stream does not exist"
-        assert response.status_code == 422, f"Expected 422 for missing message, got {response.status_code}"
-
-    def test_stream_empty_body_returns_422(self, client):
-        """Stream should return 422 when request body is empty."""
-        response = client.post(
-            "/chat/stream",
-            json={}
-        )
-
-        assert response.status_code != 404, "Endpoint /chat/stream does not exist"
-        assert response.status_code == 422, f"Expected 422 for empty body, got {response.status_code}"
+        assert response.status_code == 422, f"Expected 422 for {payload}, got {response.status_code}"
 
-    def test_stream_null_message_returns_422(self, client):
-        """Stream should return 422 when message is null."""
-        response = client.post(
-            "/chat/stream",
-            json={
-                "message": None,
-                "creator_id": "test-creator-123"
-            }
-        )
-
-        assert response.status_code != 404, "Endpoint /chat/stream does not exist"
-        assert response.status_code == 422, f"Expected 422 for null message, got {response.status_code}"
-
-    def test_stream_missing_creator_id_returns_401(self, client):
+    async def test_stream_missing_creator_id_returns_401(self, app):
         """Stream should return 401 when creator_id is missing and no auth token."""
-        response = client.post(
+        response = await stream_collect(
+            app,
             "/chat/stream",
             json={
                 "message": "What is Python?"
@@ -414,70 +508,78 @@ class TestStreamValidation:
 class TestStreamEdgeCases:
     """Tests for stream edge cases and error handling."""
 
-    def test_stream_handles_empty_response_gracefully(self, client):
+    async def test_stream_handles_empty_response_gracefully(self, app, stream_deps):
         """Stream should handle empty AI response gracefully."""
-        with mock_stream_dependencies(response_text=""):
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "",  # Empty message
-                    "creator_id": "test-creator-123"
-                }
-            )
+        _, _, mock_response = stream_deps
+        mock_response["response"] = ""
+
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "",  # Empty message
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            # Should still return 200 with at least a done event
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
-            assert len(done_events) == 1, "Should have exactly one done event"
+        # Should still return 200 with at least a done event
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
+        assert parsed.done is not None, "Should have exactly one done event"
 
-    def test_stream_connection_can_be_closed(self, client):
+    async def test_stream_connection_can_be_closed(self, app, stream_deps):
         """Stream connection should be closeable without errors."""
-        with mock_stream_dependencies():
-            # Using context manager ensures proper cleanup
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Test",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Test",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            # Connection should close properly - response should be complete
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            # Verify we can read the full response
-            _ = response.text
-            assert True, "Connection closed cleanly"
+        # Connection should close properly - response should be complete
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        # The body should end on a complete frame
+        assert response.content.endswith(b"\n\n"), "Connection closed mid-frame"
 
-    def test_stream_handles_special_characters_in_tokens(self, client):
+    async def test_stream_handles_special_characters_in_tokens(self, app, stream_deps):
         """Stream should handle special characters and unicode in tokens."""
-        with mock_stream_dependencies(response_text="Special chars: <>&\"' and unicode test"):
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "What about special chars: <>&\"' and unicode?",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        _, _, mock_response = stream_deps
+        mock_response["response"] = "Special chars: <>&\"' and unicode: café, naïve, 日本語 ✓"
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            # All events should be valid JSON (no encoding errors)
-            assert len(events) > 0, "Should have events"
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "What about special chars: <>&\"' and unicode?",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-    def test_stream_handles_newlines_in_tokens(self, client):
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        parsed = parse_sse_events(response.content)
+        # All events should be valid JSON (no encoding errors)
+        assert len(parsed.all) > 0, "Should have events"
+        # Multi-byte UTF-8 should survive the bytes-level parse intact
+        assert "".join(e["content"] for e in parsed.tokens) == mock_response["response"]
+
+    async def test_stream_handles_newlines_in_tokens(self, app, stream_deps):
         """Stream should handle newlines within token content."""
-        with mock_stream_dependencies(response_text="Line one\nLine two\nLine three"):
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Give me a multiline response",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        _, _, mock_response = stream_deps
+        mock_response["response"] = "Line one\nLine two\nLine three"
 
-            # Should handle newlines properly in JSON encoding
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Give me a multiline response",
+                "creator_id": "test-creator-123"
+            }
+        )
+
+        # Should handle newlines properly in JSON encoding
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
 
 # =============================================================================
@@ -487,48 +589,109 @@ class TestStreamEdgeCases:
 class TestStreamDatabaseInteraction:
     """Tests for stream database interactions."""
 
-    def test_stream_saves_conversation_after_completion(self, client):
+    async def test_stream_saves_conversation_after_completion(self, app, stream_deps):
         """Stream should save conversation to database after stream completes."""
-        with mock_stream_dependencies() as (mock_process, mock_db, mock_response):
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "What is Python?",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        _, mock_db, _ = stream_deps
 
-            # Consume the full response
-            _ = response.text
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "What is Python?",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            # Verify save_conversation was called
-            save_calls = [c for c in mock_db.call_history if c["method"] == "save_conversation"]
-            assert len(save_calls) == 1, "save_conversation should be called once"
-            assert save_calls[0]["creator_id"] == "test-creator-123"
+        # Verify save_conversation was called
+        save_calls = mock_db.calls_by_method["save_conversation"]
+        assert len(save_calls) == 1, "save_conversation should be called once"
+        assert save_calls[0]["creator_id"] == "test-creator-123"
 
-    def test_stream_updates_credit_usage(self, client):
+    async def test_stream_updates_credit_usage(self, app, stream_deps):
         """Stream should update credit usage after completion."""
-        with mock_stream_dependencies() as (mock_process, mock_db, mock_response):
-            mock_db.set_creator_credits("test-creator-123", 100)
+        _, mock_db, _ = stream_deps
 
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Question",
-                    "creator_id": "test-creator-123"
-                }
+        mock_db.set_creator_credits("test-creator-123", 100)
+
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Question",
+                "creator_id": "test-creator-123"
+            }
+        )
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        # Verify update_credit_usage was called
+        credit_calls = mock_db.calls_by_method["update_credit_usage"]
+        assert len(credit_calls) == 1, "update_credit_usage should be called once"
+
+    async def test_stream_defers_database_writes_to_background(self, stream_deps):
+        """With background tasks, no write should happen until the tasks run."""
+        _, mock_db, _ = stream_deps
+        background = BackgroundTasks()
+
+        chunks = [
+            chunk async for chunk in stream_chat_generator(
+                message_text="What is Python?",
+                creator_id="test-creator-123",
+                conversation_id="conv-1",
+                database=mock_db,
+                background=background
             )
+        ]
+
+        assert parse_sse_events(b"".join(chunks)).done is not None
+        assert mock_db.calls_by_method["save_conversation"] == []
+
+        await background()
+
+        assert len(mock_db.calls_by_method["save_conversation"]) == 1
+        assert len(mock_db.calls_by_method["update_credit_usage"]) == 1
+
+
+# =============================================================================
+# Response Cache Tests
+# =============================================================================
+
+class TestStreamResponseCache:
+    """Tests for replaying cached answers on repeated stream questions."""
+
+    async def _stream_tokens(self, app, message):
+        """Stream a question and return the concatenated token content."""
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": message,
+                "creator_id": "test-creator-123"
+            }
+        )
+        return "".join(e["content"] for e in parse_sse_events(response.content).tokens)
 
-            # Consume the full response
-            _ = response.text
+    async def test_repeated_question_is_replayed_from_cache(self, app, stream_deps):
+        """A repeated question should stream the cached answer, not a new one."""
+        _, mock_db, mock_response = stream_deps
+        first = await self._stream_tokens(app, "What is Python?")
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        mock_response["response"] = "A different answer"
+        second = await self._stream_tokens(app, "What is Python?")
 
-            # Verify update_credit_usage was called
-            credit_calls = [c for c in mock_db.call_history if c["method"] == "update_credit_usage"]
-            assert len(credit_calls) == 1, "update_credit_usage should be called once"
+        assert second == first
+        assert len(mock_db.calls_by_method["save_conversation"]) == 2
+
+    async def test_escalated_answer_is_not_cached(self, app, stream_deps):
+        """Escalated answers should be regenerated on the next request."""
+        _, _, mock_response = stream_deps
+        mock_response["should_escalate"] = True
+        await self._stream_tokens(app, "What is the refund policy?")
+
+        mock_response["response"] = "Refunds take 5 days"
+        assert await self._stream_tokens(app, "What is the refund policy?") == "Refunds take 5 days"
 
 
 # =============================================================================
@@ -538,36 +701,99 @@ class TestStreamDatabaseInteraction:
 class TestSSEFormatCompliance:
     """Tests for SSE format compliance."""
 
-    def test_stream_events_use_data_prefix(self, client):
+    async def test_stream_events_use_data_prefix(self, app, stream_deps):
         """SSE events should use 'data: ' prefix."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Test",
-                    "creator_id": "test-creator-123"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Test",
+                "creator_id": "test-creator-123"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            # Check raw response contains "data: " prefix
-            assert "data: " in response.text, f"Expected 'data: ' prefix in response"
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        # Check raw response contains "data: " prefix
+        assert b"data: " in response.content, f"Expected 'data: ' prefix in response"
 
-    def test_stream_events_separated_by_double_newline(self, client):
+    async def test_stream_events_separated_by_double_newline(self, app, stream_deps):
         """SSE events should be separated by double newlines."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Test message for events",
-                    "creator_id": "test-creator-123"
-                }
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Test message for events",
+                "creator_id": "test-creator-123"
+            }
+        )
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        # Events should be separated by blank lines (double newline)
+        # In SSE format: "data: {...}\n\ndata: {...}\n\n"
+        assert b"\n\n" in response.content, "Events should be separated by double newlines"
+
+    async def test_stream_generator_yields_one_bytes_frame_per_event(self, stream_deps):
+        """Each chunk from the generator should be one complete bytes SSE frame."""
+        _, mock_db, _ = stream_deps
+
+        chunks = [
+            chunk async for chunk in stream_chat_generator(
+                message_text="Test",
+                creator_id="test-creator-123",
+                conversation_id="conv-1",
+                database=mock_db
             )
+        ]
+
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert all(chunk.startswith(b"data: ") and chunk.endswith(b"\n\n") for chunk in chunks)
+        assert parse_sse_events(b"".join(chunks)).done is not None
+
+    @pytest.mark.parametrize("response_text", [
+        "Hello world this is a test response",
+        "",
+        " ".join(f"w{i}" for i in range(STREAM_TOKENS_PER_FRAME * 3)),
+    ])
+    async def test_stream_body_matches_expected_frames(self, app, stream_deps, response_text):
+        """The raw body should equal the precomputed frames byte for byte."""
+        _, _, mock_response = stream_deps
+        mock_response["response"] = response_text
+
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Byte exact please",
+                "creator_id": "test-creator-123",
+                "conversation_id": "conv-exact"
+            }
+        )
+
+        assert response.content == expected_sse_body(
+            response_text,
+            tuple(mock_response["sources"]),
+            mock_response["should_escalate"],
+            "conv-exact"
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            # Events should be separated by blank lines (double newline)
-            # In SSE format: "data: {...}\n\ndata: {...}\n\n"
-            assert "\n\n" in response.text, "Events should be separated by double newlines"
+    async def test_stream_coalesces_words_into_frames(self, app, stream_deps):
+        """Consecutive words should be packed into frames without losing order."""
+        _, _, mock_response = stream_deps
+        words = [f"w{i}" for i in range(STREAM_TOKENS_PER_FRAME * 2 + 1)]
+        mock_response["response"] = " ".join(words)
+
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Long answer please",
+                "creator_id": "test-creator-123"
+            }
+        )
+
+        token_events = parse_sse_events(response.content).tokens
+        assert len(token_events) == 3
+        assert "".join(e["content"] for e in token_events) == mock_response["response"]
 
 
 # =============================================================================
@@ -577,43 +803,60 @@ class TestSSEFormatCompliance:
 class TestStreamConversationId:
     """Tests for conversation ID handling in streams."""
 
-    def test_stream_uses_provided_conversation_id(self, client):
+    async def test_stream_uses_provided_conversation_id(self, app, stream_deps):
         """Stream should use provided conversation_id in final event."""
-        with mock_stream_dependencies():
-            response = client.post(
-                "/chat/stream",
-                json={
-                    "message": "Follow-up question",
-                    "creator_id": "test-creator-123",
-                    "conversation_id": "existing-conv-456"
-                }
-            )
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "Follow-up question",
+                "creator_id": "test-creator-123",
+                "conversation_id": "existing-conv-456"
+            }
+        )
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        done_event = parse_sse_events(response.content).done
 
-            assert len(done_events) == 1, "Expected exactly 1 done event"
-            assert done_events[0].get("conversation_id") == "existing-conv-456", \
-                f"Expected conversation_id 'existing-conv-456', got {done_events[0].get('conversation_id')}"
+        assert done_event is not None, "Expected exactly 1 done event"
+        assert done_event.get("conversation_id") == "existing-conv-456", \
+            f"Expected conversation_id 'existing-conv-456', got {done_event.get('conversation_id')}"
 
-    def test_stream_generates_conversation_id_if_not_provided(self, client):
+    async def test_stream_generates_conversation_id_if_not_provided(self, app, stream_deps):
         """Stream should generate a conversation_id if not provided."""
-        with mock_stream_dependencies():
-            response = client.post(
+        response = await stream_collect(
+            app,
+            "/chat/stream",
+            json={
+                "message": "New conversation",
+                "creator_id": "test-creator-123"
+                # No conversation_id provided
+            }
+        )
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        done_event = parse_sse_events(response.content).done
+
+        assert done_event is not None, "Expected exactly 1 done event"
+        assert "conversation_id" in done_event, "Should have conversation_id"
+        assert done_event["conversation_id"] is not None, "conversation_id should not be None"
+        assert len(done_event["conversation_id"]) > 0, "conversation_id should not be empty"
+
+    async def test_generated_conversation_ids_are_time_ordered_uuid7(self, app, stream_deps):
+        """Generated conversation_ids should be UUIDv7 and sort in creation order."""
+        import uuid
+
+        ids = []
+        for _ in range(3):
+            response = await stream_collect(
+                app,
                 "/chat/stream",
                 json={
                     "message": "New conversation",
                     "creator_id": "test-creator-123"
-                    # No conversation_id provided
                 }
             )
+            ids.append(parse_sse_events(response.content).done["conversation_id"])
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-            events = parse_sse_events(response.text)
-            done_events = [e for e in events if e.get("type") == "done"]
-
-            assert len(done_events) == 1, "Expected exactly 1 done event"
-            assert "conversation_id" in done_events[0], "Should have conversation_id"
-            assert done_events[0]["conversation_id"] is not None, "conversation_id should not be None"
-            assert len(done_events[0]["conversation_id"]) > 0, "conversation_id should not be empty"
+        assert all(uuid.UUID(conv_id).version == 7 for conv_id in ids)
+        assert ids == sorted(ids)
@@ -10,47 +10,140 @@ Tests cover:
 - Per-service configurations
 - Stats tracking
 - Timeout behavior
+
+Every test gets its own breaker registry, so the module is safe under
+pytest-xdist (pytest tests/ -n auto --dist loadgroup).
 """
 
 import pytest
 import time
 import asyncio
+import importlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, AsyncMock, patch
-from dataclasses import dataclass
+from dataclasses import dataclass, FrozenInstanceError
+from typing import List
+
+from app.config.resilience import (
+    CircuitBreakerConfig,
+    DEFAULT_CONFIG,
+    OPENAI_CONFIG,
+    PINECONE_CONFIG,
+    SERVICE_CONFIGS,
+    get_config,
+)
+from app.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerError,
+    CircuitState,
+    CircuitStats,
+    circuit_breaker as cb_decorator,
+    get_breaker,
+)
+
+# app.utils re-exports the circuit_breaker decorator under the submodule's name
+circuit_breaker_module = importlib.import_module("app.utils.circuit_breaker")
+BREAKER_LOGGER = circuit_breaker_module.logger.name
+
+# Keep the module on one xdist worker so its module-scoped breakers are built once
+pytestmark = pytest.mark.xdist_group("circuit_breaker")
 
 
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
+def seconds_ago(seconds: float) -> int:
+    """Return a monotonic-ns timestamp the given number of seconds in the past."""
+    return time.monotonic_ns() - int(seconds * 1_000_000_000)
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """One event loop for the module's sync tests that drive a single coroutine."""
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Give each test an empty get_breaker() registry of its own."""
+    registry = {}
+    monkeypatch.setattr(circuit_breaker_module, "_breakers", registry)
+    return registry
+
+
+def _force_open(breaker: CircuitBreaker):
+    """Put a breaker straight into OPEN as if it had just hit its failure threshold."""
+    breaker._stats.failures = breaker.config.failure_threshold
+    breaker._stats.last_failure_time = circuit_breaker_module.time.monotonic_ns()
+    breaker._state = CircuitState.OPEN
+
+
+class FakeClock:
+    """Stand-in for the time module that only moves when advanced."""
+
+    def __init__(self, start_ns: int = 1_700_000_000 * 1_000_000_000):
+        self._now_ns = start_ns
+
+    def monotonic_ns(self) -> int:
+        return self._now_ns
+
+    def advance(self, seconds: float):
+        """Move the clock forward by the given number of seconds."""
+        self._now_ns += int(seconds * 1_000_000_000)
+
+
 @pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive the circuit breaker's clock by hand instead of sleeping."""
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module, "time", clock)
+    return clock
+
+
+@pytest.fixture(scope="module")
 def default_config():
-    """Create a default circuit breaker configuration."""
-    from app.config.resilience import CircuitBreakerConfig
+    """Create a default circuit breaker configuration (frozen, so shared)."""
     return CircuitBreakerConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def strict_config():
     """Create a strict circuit breaker configuration with low thresholds."""
-    from app.config.resilience import CircuitBreakerConfig
     return CircuitBreakerConfig(failure_threshold=2, success_threshold=1, timeout_seconds=5.0)
 
 
-@pytest.fixture
-def circuit_breaker():
-    """Create a fresh circuit breaker for each test."""
-    from app.utils.circuit_breaker import CircuitBreaker
+@pytest.fixture(scope="module")
+def _shared_breaker():
+    """One default breaker for the module; circuit_breaker resets it per test."""
     return CircuitBreaker("test_service")
 
 
-@pytest.fixture
-def circuit_breaker_strict(strict_config):
-    """Create a circuit breaker with strict configuration."""
-    from app.utils.circuit_breaker import CircuitBreaker
+@pytest.fixture(scope="module")
+def _shared_strict_breaker(strict_config):
+    """One strict breaker for the module; circuit_breaker_strict resets it per test."""
     return CircuitBreaker("test_service", config=strict_config)
 
 
+@pytest.fixture
+def circuit_breaker(_shared_breaker):
+    """Provide the shared default breaker, closed with fresh stats."""
+    _shared_breaker.reset()
+    _shared_breaker.config = DEFAULT_CONFIG
+    return _shared_breaker
+
+
+@pytest.fixture
+def circuit_breaker_strict(_shared_strict_breaker, strict_config):
+    """Provide the shared strict breaker, closed with fresh stats."""
+    _shared_strict_breaker.reset()
+    _shared_strict_breaker.config = strict_config
+    return _shared_strict_breaker
+
+
 # =============================================================================
 # Test CircuitBreakerConfig
 # =============================================================================
@@ -60,7 +153,6 @@ class TestCircuitBreakerConfig:
 
     def test_config_creation_with_defaults(self):
         """Test default configuration values."""
-        from app.config.resilience import CircuitBreakerConfig
         config = CircuitBreakerConfig()
         assert config.failure_threshold == 5
         assert config.success_threshold == 3
@@ -68,7 +160,6 @@ class TestCircuitBreakerConfig:
 
     def test_config_creation_with_custom_values(self):
         """Test configuration with custom values."""
-        from app.config.resilience import CircuitBreakerConfig
         config = CircuitBreakerConfig(
             failure_threshold=10,
             success_threshold=5,
@@ -80,7 +171,6 @@ class TestCircuitBreakerConfig:
 
     def test_config_is_dataclass(self):
         """Test that config is a proper dataclass."""
-        from app.config.resilience import CircuitBreakerConfig
         config = CircuitBreakerConfig()
         # Dataclasses should have __dataclass_fields__
         assert hasattr(config, '__dataclass_fields__')
@@ -91,42 +181,46 @@ class TestServiceConfigs:
 
     def test_openai_config_exists(self):
         """Test that OpenAI has specific configuration."""
-        from app.config.resilience import SERVICE_CONFIGS
         assert "openai" in SERVICE_CONFIGS
         assert SERVICE_CONFIGS["openai"].failure_threshold == 3
         assert SERVICE_CONFIGS["openai"].timeout_seconds == 60
 
     def test_pinecone_config_exists(self):
         """Test that Pinecone has specific configuration."""
-        from app.config.resilience import SERVICE_CONFIGS
         assert "pinecone" in SERVICE_CONFIGS
         assert SERVICE_CONFIGS["pinecone"].failure_threshold == 5
         assert SERVICE_CONFIGS["pinecone"].timeout_seconds == 30
 
     def test_supabase_config_exists(self):
         """Test that Supabase has specific configuration."""
-        from app.config.resilience import SERVICE_CONFIGS
         assert "supabase" in SERVICE_CONFIGS
         assert SERVICE_CONFIGS["supabase"].failure_threshold == 5
         assert SERVICE_CONFIGS["supabase"].timeout_seconds == 30
 
     def test_default_config_exists(self):
         """Test that default configuration exists."""
-        from app.config.resilience import SERVICE_CONFIGS
         assert "default" in SERVICE_CONFIGS
 
     def test_get_config_returns_service_specific(self):
         """Test get_config returns service-specific config."""
-        from app.config.resilience import get_config
         config = get_config("openai")
         assert config.failure_threshold == 3
 
     def test_get_config_returns_default_for_unknown(self):
         """Test get_config returns default for unknown service."""
-        from app.config.resilience import get_config, SERVICE_CONFIGS
         config = get_config("unknown_service")
         assert config == SERVICE_CONFIGS["default"]
 
+    def test_get_config_returns_shared_instance(self):
+        """Test get_config hands back the module constant, not a copy."""
+        assert get_config("openai") is OPENAI_CONFIG
+        assert get_config("unknown_service") is DEFAULT_CONFIG
+
+    def test_service_configs_are_immutable(self):
+        """Test that shared configs cannot be mutated by one caller."""
+        with pytest.raises(FrozenInstanceError):
+            DEFAULT_CONFIG.failure_threshold = 1
+
 
 # =============================================================================
 # Test CircuitState Enum
@@ -137,22 +231,18 @@ class TestCircuitState:
 
     def test_circuit_state_closed(self):
         """Test CLOSED state value."""
-        from app.utils.circuit_breaker import CircuitState
         assert CircuitState.CLOSED.value == "closed"
 
     def test_circuit_state_open(self):
         """Test OPEN state value."""
-        from app.utils.circuit_breaker import CircuitState
         assert CircuitState.OPEN.value == "open"
 
     def test_circuit_state_half_open(self):
         """Test HALF_OPEN state value."""
-        from app.utils.circuit_breaker import CircuitState
         assert CircuitState.HALF_OPEN.value == "half_open"
 
     def test_all_states_defined(self):
         """Test all three states are defined."""
-        from app.utils.circuit_breaker import CircuitState
         states = list(CircuitState)
         assert len(states) == 3
 
@@ -166,27 +256,30 @@ class TestCircuitStats:
 
     def test_stats_default_values(self):
         """Test default stats values."""
-        from app.utils.circuit_breaker import CircuitStats
         stats = CircuitStats()
         assert stats.failures == 0
         assert stats.successes == 0
-        assert stats.last_failure_time == 0.0
+        assert stats.last_failure_time == 0
         assert stats.consecutive_successes == 0
 
     def test_stats_custom_values(self):
         """Test stats with custom values."""
-        from app.utils.circuit_breaker import CircuitStats
         stats = CircuitStats(
             failures=5,
             successes=10,
-            last_failure_time=1000.0,
+            last_failure_time=1000,
             consecutive_successes=3
         )
         assert stats.failures == 5
         assert stats.successes == 10
-        assert stats.last_failure_time == 1000.0
+        assert stats.last_failure_time == 1000
         assert stats.consecutive_successes == 3
 
+    def test_stats_and_breaker_use_slots(self, circuit_breaker):
+        """Test stats and breakers carry no per-instance __dict__."""
+        assert not hasattr(CircuitStats(), "__dict__")
+        assert not hasattr(circuit_breaker, "__dict__")
+
 
 # =============================================================================
 # Test CircuitBreakerError
@@ -197,27 +290,23 @@ class TestCircuitBreakerError:
 
     def test_error_creation(self):
         """Test error creation with service and retry_after."""
-        from app.utils.circuit_breaker import CircuitBreakerError
         error = CircuitBreakerError("openai", 30.0)
         assert error.service == "openai"
         assert error.retry_after == 30.0
 
     def test_error_message(self):
         """Test error message format."""
-        from app.utils.circuit_breaker import CircuitBreakerError
         error = CircuitBreakerError("openai", 30.0)
         assert "openai" in str(error)
         assert "30.0" in str(error)
 
     def test_error_inheritance(self):
         """Test error inherits from Exception."""
-        from app.utils.circuit_breaker import CircuitBreakerError
         error = CircuitBreakerError("test", 10.0)
         assert isinstance(error, Exception)
 
     def test_error_zero_retry_after(self):
         """Test error with zero retry_after."""
-        from app.utils.circuit_breaker import CircuitBreakerError
         error = CircuitBreakerError("test", 0.0)
         assert error.retry_after == 0.0
 
@@ -231,7 +320,6 @@ class TestCircuitBreakerClosedState:
 
     def test_initial_state_is_closed(self, circuit_breaker):
         """Test that circuit starts in CLOSED state."""
-        from app.utils.circuit_breaker import CircuitState
         assert circuit_breaker.state == CircuitState.CLOSED
         assert circuit_breaker.is_closed is True
 
@@ -247,7 +335,6 @@ class TestCircuitBreakerClosedState:
 
     def test_success_in_closed_state(self, circuit_breaker):
         """Test recording success in CLOSED state resets failures."""
-        from app.utils.circuit_breaker import CircuitState
         circuit_breaker._stats.failures = 2
         circuit_breaker.record_success()
         assert circuit_breaker._stats.failures == 0
@@ -255,13 +342,11 @@ class TestCircuitBreakerClosedState:
 
     def test_single_failure_keeps_closed(self, circuit_breaker):
         """Test single failure keeps circuit closed."""
-        from app.utils.circuit_breaker import CircuitState
         circuit_breaker.record_failure()
         assert circuit_breaker.state == CircuitState.CLOSED
 
     def test_failures_below_threshold_keeps_closed(self, circuit_breaker):
         """Test failures below threshold keep circuit closed."""
-        from app.utils.circuit_breaker import CircuitState
         for _ in range(circuit_breaker.config.failure_threshold - 1):
             circuit_breaker.record_failure()
         assert circuit_breaker.state == CircuitState.CLOSED
@@ -276,7 +361,6 @@ class TestCircuitBreakerOpens:
 
     def test_opens_after_failure_threshold(self, circuit_breaker_strict):
         """Test circuit opens after reaching failure threshold."""
-        from app.utils.circuit_breaker import CircuitState
         # strict_config has failure_threshold=2
         circuit_breaker_strict.record_failure()
         assert circuit_breaker_strict.state == CircuitState.CLOSED
@@ -311,16 +395,15 @@ class TestCircuitBreakerOpens:
 
     def test_last_failure_time_recorded(self, circuit_breaker_strict):
         """Test that last failure time is recorded."""
-        before = time.time()
+        before = time.monotonic_ns()
         circuit_breaker_strict.record_failure()
-        after = time.time()
+        after = time.monotonic_ns()
 
         assert circuit_breaker_strict._stats.last_failure_time >= before
         assert circuit_breaker_strict._stats.last_failure_time <= after
 
     def test_default_config_failure_threshold(self, circuit_breaker):
         """Test default config requires 5 failures to open."""
-        from app.utils.circuit_breaker import CircuitState
         for _ in range(4):
             circuit_breaker.record_failure()
         assert circuit_breaker.state == CircuitState.CLOSED
@@ -338,25 +421,21 @@ class TestCircuitBreakerHalfOpen:
 
     def test_transitions_to_half_open_after_timeout(self, circuit_breaker_strict):
         """Test circuit transitions to HALF_OPEN after timeout."""
-        from app.utils.circuit_breaker import CircuitState
         # Open the circuit
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
         assert circuit_breaker_strict._state == CircuitState.OPEN
 
         # Simulate timeout passing
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
 
         # Access state property should trigger transition
         assert circuit_breaker_strict.state == CircuitState.HALF_OPEN
 
     def test_half_open_allows_test_request(self, circuit_breaker_strict):
         """Test HALF_OPEN state allows test requests."""
-        from app.utils.circuit_breaker import CircuitState
         # Open and transition to half-open
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        _force_open(circuit_breaker_strict)
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
 
         # Should allow request
         assert circuit_breaker_strict.state == CircuitState.HALF_OPEN
@@ -364,9 +443,8 @@ class TestCircuitBreakerHalfOpen:
 
     def test_half_open_state_properties(self, circuit_breaker_strict):
         """Test state properties when half-open."""
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        _force_open(circuit_breaker_strict)
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
 
         # Trigger transition
         _ = circuit_breaker_strict.state
@@ -377,11 +455,9 @@ class TestCircuitBreakerHalfOpen:
 
     def test_success_in_half_open_closes_circuit(self, circuit_breaker_strict):
         """Test success in HALF_OPEN closes circuit (success_threshold=1)."""
-        from app.utils.circuit_breaker import CircuitState
         # Open and transition to half-open
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        _force_open(circuit_breaker_strict)
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
         circuit_breaker_strict._state = CircuitState.HALF_OPEN
 
         # Record success
@@ -391,11 +467,9 @@ class TestCircuitBreakerHalfOpen:
 
     def test_failure_in_half_open_reopens_circuit(self, circuit_breaker_strict):
         """Test failure in HALF_OPEN reopens circuit."""
-        from app.utils.circuit_breaker import CircuitState
         # Open and transition to half-open
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        _force_open(circuit_breaker_strict)
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
         circuit_breaker_strict._state = CircuitState.HALF_OPEN
 
         # Record failure
@@ -405,14 +479,12 @@ class TestCircuitBreakerHalfOpen:
 
     def test_multiple_successes_needed_to_close(self, default_config):
         """Test that multiple successes may be needed to close."""
-        from app.utils.circuit_breaker import CircuitBreaker, CircuitState
         # Use config that requires 3 successes
         breaker = CircuitBreaker("test", config=default_config)
 
         # Open and transition to half-open
-        for _ in range(5):
-            breaker.record_failure()
-        breaker._stats.last_failure_time = time.time() - 60
+        _force_open(breaker)
+        breaker._stats.last_failure_time = seconds_ago(60)
         breaker._state = CircuitState.HALF_OPEN
 
         # First success
@@ -437,9 +509,7 @@ class TestCircuitBreakerGracefulError:
 
     def test_error_includes_service_name(self, circuit_breaker_strict):
         """Test that error includes service name."""
-        from app.utils.circuit_breaker import CircuitBreakerError
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         try:
             if not circuit_breaker_strict.allow_request():
@@ -452,9 +522,7 @@ class TestCircuitBreakerGracefulError:
 
     def test_error_includes_retry_after(self, circuit_breaker_strict):
         """Test that error includes retry_after value."""
-        from app.utils.circuit_breaker import CircuitBreakerError
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         retry_after = circuit_breaker_strict.get_retry_after()
         error = CircuitBreakerError(circuit_breaker_strict.service, retry_after)
@@ -463,7 +531,6 @@ class TestCircuitBreakerGracefulError:
 
     def test_graceful_error_message_format(self, circuit_breaker_strict):
         """Test graceful error message format."""
-        from app.utils.circuit_breaker import CircuitBreakerError
         error = CircuitBreakerError("openai", 25.5)
         msg = str(error)
         assert "Circuit breaker open" in msg
@@ -480,8 +547,7 @@ class TestRetryAfterCalculation:
 
     def test_retry_after_when_just_opened(self, circuit_breaker_strict):
         """Test retry_after equals timeout when just opened."""
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         retry_after = circuit_breaker_strict.get_retry_after()
         # Should be close to timeout_seconds (5.0)
@@ -490,11 +556,10 @@ class TestRetryAfterCalculation:
 
     def test_retry_after_decreases_over_time(self, circuit_breaker_strict):
         """Test retry_after decreases as time passes."""
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         # Simulate 3 seconds passing
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 3
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(3)
 
         retry_after = circuit_breaker_strict.get_retry_after()
         # Should be close to 2 seconds (5 - 3)
@@ -507,11 +572,10 @@ class TestRetryAfterCalculation:
 
     def test_retry_after_zero_after_timeout(self, circuit_breaker_strict):
         """Test retry_after is zero after timeout expires."""
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         # Simulate timeout passing
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
 
         retry_after = circuit_breaker_strict.get_retry_after()
         assert retry_after == 0.0
@@ -526,9 +590,7 @@ class TestCircuitReset:
 
     def test_reset_clears_state(self, circuit_breaker_strict):
         """Test reset returns circuit to closed state."""
-        from app.utils.circuit_breaker import CircuitState
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
         assert circuit_breaker_strict._state == CircuitState.OPEN
 
         circuit_breaker_strict.reset()
@@ -536,13 +598,12 @@ class TestCircuitReset:
 
     def test_reset_clears_stats(self, circuit_breaker_strict):
         """Test reset clears all stats."""
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         circuit_breaker_strict.reset()
         assert circuit_breaker_strict._stats.failures == 0
         assert circuit_breaker_strict._stats.successes == 0
-        assert circuit_breaker_strict._stats.last_failure_time == 0.0
+        assert circuit_breaker_strict._stats.last_failure_time == 0
         assert circuit_breaker_strict._stats.consecutive_successes == 0
 
 
@@ -553,66 +614,58 @@ class TestCircuitReset:
 class TestCircuitBreakerExecute:
     """Tests for circuit breaker execute method."""
 
-    @pytest.mark.asyncio
-    async def test_execute_success(self, circuit_breaker):
+    def test_execute_success(self, circuit_breaker, loop):
         """Test execute with successful function."""
         async def success_func():
             return "success"
 
-        result = await circuit_breaker.execute(success_func)
+        result = loop.run_until_complete(circuit_breaker.execute(success_func))
         assert result == "success"
 
-    @pytest.mark.asyncio
-    async def test_execute_records_success(self, circuit_breaker):
+    def test_execute_records_success(self, circuit_breaker, loop):
         """Test execute records success on successful call."""
         async def success_func():
             return "success"
 
-        await circuit_breaker.execute(success_func)
+        loop.run_until_complete(circuit_breaker.execute(success_func))
         # Failure count should remain 0
         assert circuit_breaker._stats.failures == 0
 
-    @pytest.mark.asyncio
-    async def test_execute_failure_records_failure(self, circuit_breaker):
+    def test_execute_failure_records_failure(self, circuit_breaker, loop):
         """Test execute records failure on exception."""
         async def failing_func():
             raise ValueError("test error")
 
         with pytest.raises(ValueError):
-            await circuit_breaker.execute(failing_func)
+            loop.run_until_complete(circuit_breaker.execute(failing_func))
 
         assert circuit_breaker._stats.failures == 1
 
-    @pytest.mark.asyncio
-    async def test_execute_raises_circuit_breaker_error_when_open(self, circuit_breaker_strict):
+    def test_execute_raises_circuit_breaker_error_when_open(self, circuit_breaker_strict, loop):
         """Test execute raises CircuitBreakerError when circuit is open."""
-        from app.utils.circuit_breaker import CircuitBreakerError
         # Open the circuit
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+        _force_open(circuit_breaker_strict)
 
         async def success_func():
             return "success"
 
         with pytest.raises(CircuitBreakerError):
-            await circuit_breaker_strict.execute(success_func)
+            loop.run_until_complete(circuit_breaker_strict.execute(success_func))
 
-    @pytest.mark.asyncio
-    async def test_execute_with_args(self, circuit_breaker):
+    def test_execute_with_args(self, circuit_breaker, loop):
         """Test execute passes args to function."""
         async def func_with_args(a, b):
             return a + b
 
-        result = await circuit_breaker.execute(func_with_args, 1, 2)
+        result = loop.run_until_complete(circuit_breaker.execute(func_with_args, 1, 2))
         assert result == 3
 
-    @pytest.mark.asyncio
-    async def test_execute_with_kwargs(self, circuit_breaker):
+    def test_execute_with_kwargs(self, circuit_breaker, loop):
         """Test execute passes kwargs to function."""
         async def func_with_kwargs(a, b=10):
             return a + b
 
-        result = await circuit_breaker.execute(func_with_kwargs, 5, b=20)
+        result = loop.run_until_complete(circuit_breaker.execute(func_with_kwargs, 5, b=20))
         assert result == 25
 
 
@@ -625,8 +678,6 @@ class TestCircuitBreakerDecorator:
 
     def test_decorator_creates_breaker(self):
         """Test decorator creates circuit breaker for function."""
-        from app.utils.circuit_breaker import circuit_breaker as cb_decorator
-
         @cb_decorator("test_service")
         async def test_func():
             return "result"
@@ -635,45 +686,34 @@ class TestCircuitBreakerDecorator:
 
     def test_decorator_uses_service_name(self):
         """Test decorator uses provided service name."""
-        from app.utils.circuit_breaker import circuit_breaker as cb_decorator
-
         @cb_decorator("custom_service")
         async def test_func():
             return "result"
 
         assert test_func.circuit_breaker.service == "custom_service"
 
-    @pytest.mark.asyncio
-    async def test_decorator_executes_function(self):
+    def test_decorator_executes_function(self, loop):
         """Test decorated function executes normally."""
-        from app.utils.circuit_breaker import circuit_breaker as cb_decorator
-
         @cb_decorator("test_service")
         async def test_func():
             return "result"
 
-        result = await test_func()
+        result = loop.run_until_complete(test_func())
         assert result == "result"
 
-    @pytest.mark.asyncio
-    async def test_decorator_tracks_failures(self):
+    def test_decorator_tracks_failures(self, loop):
         """Test decorator tracks failures."""
-        from app.utils.circuit_breaker import circuit_breaker as cb_decorator
-
         @cb_decorator("test_service")
         async def failing_func():
             raise ValueError("error")
 
         with pytest.raises(ValueError):
-            await failing_func()
+            loop.run_until_complete(failing_func())
 
         assert failing_func.circuit_breaker._stats.failures == 1
 
-    @pytest.mark.asyncio
-    async def test_decorator_opens_circuit_after_threshold(self):
+    def test_decorator_opens_circuit_after_threshold(self, loop):
         """Test decorator opens circuit after failure threshold."""
-        from app.utils.circuit_breaker import circuit_breaker as cb_decorator, CircuitState, CircuitBreakerConfig
-
         config = CircuitBreakerConfig(failure_threshold=2, success_threshold=1, timeout_seconds=5.0)
 
         @cb_decorator("test_service")
@@ -686,7 +726,7 @@ class TestCircuitBreakerDecorator:
         # Cause failures
         for _ in range(2):
             with pytest.raises(ValueError):
-                await failing_func()
+                loop.run_until_complete(failing_func())
 
         assert failing_func.circuit_breaker._state == CircuitState.OPEN
 
@@ -700,21 +740,11 @@ class TestBreakerRegistry:
 
     def test_get_breaker_creates_new(self):
         """Test get_breaker creates new breaker for unknown service."""
-        from app.utils.circuit_breaker import get_breaker, _breakers
-
-        # Clear registry
-        _breakers.clear()
-
         breaker = get_breaker("new_service")
         assert breaker.service == "new_service"
 
     def test_get_breaker_returns_existing(self):
         """Test get_breaker returns existing breaker for known service."""
-        from app.utils.circuit_breaker import get_breaker, _breakers
-
-        # Clear registry
-        _breakers.clear()
-
         breaker1 = get_breaker("existing_service")
         breaker2 = get_breaker("existing_service")
 
@@ -722,11 +752,6 @@ class TestBreakerRegistry:
 
     def test_different_services_different_breakers(self):
         """Test different services get different breakers."""
-        from app.utils.circuit_breaker import get_breaker, _breakers
-
-        # Clear registry
-        _breakers.clear()
-
         breaker1 = get_breaker("service1")
         breaker2 = get_breaker("service2")
 
@@ -734,6 +759,12 @@ class TestBreakerRegistry:
         assert breaker1.service == "service1"
         assert breaker2.service == "service2"
 
+    def test_registry_is_isolated_per_test(self, isolated_registry):
+        """Test get_breaker registers into this test's own registry."""
+        breaker = get_breaker("isolated_service")
+
+        assert isolated_registry == {"isolated_service": breaker}
+
 
 # =============================================================================
 # Test Service-Specific Configurations
@@ -744,78 +775,91 @@ class TestServiceSpecificConfigs:
 
     def test_openai_breaker_uses_openai_config(self):
         """Test OpenAI service uses OpenAI-specific config."""
-        from app.utils.circuit_breaker import CircuitBreaker
         breaker = CircuitBreaker("openai")
+        assert breaker.config is OPENAI_CONFIG
         assert breaker.config.failure_threshold == 3
         assert breaker.config.timeout_seconds == 60
 
     def test_pinecone_breaker_uses_pinecone_config(self):
         """Test Pinecone service uses Pinecone-specific config."""
-        from app.utils.circuit_breaker import CircuitBreaker
         breaker = CircuitBreaker("pinecone")
+        assert breaker.config is PINECONE_CONFIG
         assert breaker.config.failure_threshold == 5
         assert breaker.config.timeout_seconds == 30
 
     def test_unknown_service_uses_default_config(self):
         """Test unknown service uses default config."""
-        from app.utils.circuit_breaker import CircuitBreaker
-        from app.config.resilience import SERVICE_CONFIGS
         breaker = CircuitBreaker("unknown_service")
-        assert breaker.config == SERVICE_CONFIGS["default"]
+        assert breaker.config is DEFAULT_CONFIG
 
 
 # =============================================================================
 # Test Logging
 # =============================================================================
 
+def breaker_events(caplog) -> List[str]:
+    """Return the structured 'event' field of each captured breaker log record."""
+    return [
+        record.extra_fields["event"]
+        for record in caplog.records
+        if "event" in getattr(record, "extra_fields", {})
+    ]
+
+
 class TestCircuitBreakerLogging:
     """Tests for circuit breaker logging."""
 
     def test_logs_circuit_open(self, circuit_breaker_strict, caplog):
         """Test logging when circuit opens."""
-        import logging
-        caplog.set_level(logging.WARNING)
+        with caplog.at_level(logging.WARNING, logger=BREAKER_LOGGER):
+            caplog.clear()
+            for _ in range(2):
+                circuit_breaker_strict.record_failure()
 
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
+            assert "circuit_open" in breaker_events(caplog)
+            assert any(r.levelno >= logging.WARNING and "OPENED" in r.message for r in caplog.records)
+
+    def test_failure_while_open_does_not_reopen(self, circuit_breaker_strict, caplog):
+        """Test further failures on an open circuit log no second OPENED."""
+        with caplog.at_level(logging.WARNING, logger=BREAKER_LOGGER):
+            caplog.clear()
+            for _ in range(4):
+                circuit_breaker_strict.record_failure()
 
-        assert any("OPENED" in record.message for record in caplog.records)
+            assert breaker_events(caplog).count("circuit_open") == 1
 
     def test_logs_circuit_close(self, circuit_breaker_strict, caplog):
         """Test logging when circuit closes."""
-        import logging
-        from app.utils.circuit_breaker import CircuitState
-        caplog.set_level(logging.INFO)
-
         # Open circuit
         for _ in range(2):
             circuit_breaker_strict.record_failure()
 
         # Transition to half-open
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
         circuit_breaker_strict._state = CircuitState.HALF_OPEN
 
         # Close circuit
-        circuit_breaker_strict.record_success()
+        with caplog.at_level(logging.INFO, logger=BREAKER_LOGGER):
+            caplog.clear()
+            circuit_breaker_strict.record_success()
 
-        assert any("CLOSED" in record.message for record in caplog.records)
+            assert breaker_events(caplog) == ["circuit_closed"]
 
     def test_logs_transition_to_half_open(self, circuit_breaker_strict, caplog):
         """Test logging when transitioning to half-open."""
-        import logging
-        caplog.set_level(logging.INFO)
-
         # Open circuit
         for _ in range(2):
             circuit_breaker_strict.record_failure()
 
         # Simulate timeout
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
 
         # Access state to trigger transition
-        _ = circuit_breaker_strict.state
+        with caplog.at_level(logging.INFO, logger=BREAKER_LOGGER):
+            caplog.clear()
+            _ = circuit_breaker_strict.state
 
-        assert any("HALF_OPEN" in record.message for record in caplog.records)
+            assert breaker_events(caplog) == ["circuit_half_open"]
 
 
 # =============================================================================
@@ -827,11 +871,9 @@ class TestEdgeCases:
 
     def test_consecutive_successes_reset_on_failure(self, circuit_breaker_strict):
         """Test consecutive successes reset on failure."""
-        from app.utils.circuit_breaker import CircuitState
         # Open and transition to half-open
-        for _ in range(2):
-            circuit_breaker_strict.record_failure()
-        circuit_breaker_strict._stats.last_failure_time = time.time() - 10
+        _force_open(circuit_breaker_strict)
+        circuit_breaker_strict._stats.last_failure_time = seconds_ago(10)
         circuit_breaker_strict._state = CircuitState.HALF_OPEN
 
         # Record some successes
@@ -842,12 +884,12 @@ class TestEdgeCases:
 
         assert circuit_breaker_strict._stats.consecutive_successes == 0
 
-    def test_failure_time_updated_on_each_failure(self, circuit_breaker):
+    def test_failure_time_updated_on_each_failure(self, circuit_breaker, fake_clock):
         """Test last_failure_time is updated on each failure."""
         circuit_breaker.record_failure()
         first_time = circuit_breaker._stats.last_failure_time
 
-        time.sleep(0.01)
+        fake_clock.advance(0.01)
 
         circuit_breaker.record_failure()
         second_time = circuit_breaker._stats.last_failure_time
@@ -856,7 +898,6 @@ class TestEdgeCases:
 
     def test_circuit_stays_closed_after_partial_failures_and_success(self, circuit_breaker_strict):
         """Test circuit stays closed if success occurs before threshold."""
-        from app.utils.circuit_breaker import CircuitState
         circuit_breaker_strict.record_failure()
         circuit_breaker_strict.record_success()
 
@@ -865,7 +906,6 @@ class TestEdgeCases:
 
     def test_very_long_timeout(self):
         """Test circuit with very long timeout."""
-        from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
         config = CircuitBreakerConfig(failure_threshold=1, timeout_seconds=3600.0)
         breaker = CircuitBreaker("test", config=config)
 
@@ -883,16 +923,11 @@ class TestEdgeCases:
 class TestConcurrentAccess:
     """Tests for concurrent access scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_concurrent_failures(self, circuit_breaker_strict):
+    def test_concurrent_failures(self, circuit_breaker_strict):
         """Test concurrent failure recording."""
-        from app.utils.circuit_breaker import CircuitState
-
-        async def record_failure():
-            circuit_breaker_strict.record_failure()
-
-        # Record failures concurrently
-        await asyncio.gather(*[record_failure() for _ in range(5)])
+        # record_failure never awaits, so real concurrency means threads
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            list(pool.map(lambda _: circuit_breaker_strict.record_failure(), range(5)))
 
         # Should be open
         assert circuit_breaker_strict._state == CircuitState.OPEN
@@ -919,11 +954,8 @@ class TestConcurrentAccess:
 class TestIntegrationScenarios:
     """Integration tests for realistic scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_full_circuit_lifecycle(self):
+    def test_full_circuit_lifecycle(self, fake_clock):
         """Test complete circuit lifecycle: closed -> open -> half-open -> closed."""
-        from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
-
         config = CircuitBreakerConfig(failure_threshold=2, success_threshold=1, timeout_seconds=0.1)
         breaker = CircuitBreaker("test", config=config)
 
@@ -936,18 +968,15 @@ class TestIntegrationScenarios:
         assert breaker._state == CircuitState.OPEN
 
         # 3. Wait for timeout, transitions to half-open
-        await asyncio.sleep(0.15)
+        fake_clock.advance(0.15)
         assert breaker.state == CircuitState.HALF_OPEN
 
         # 4. Success closes circuit
         breaker.record_success()
         assert breaker.state == CircuitState.CLOSED
 
-    @pytest.mark.asyncio
-    async def test_api_simulation_with_failing_service(self):
+    def test_api_simulation_with_failing_service(self, loop):
         """Test simulating API calls to a failing service."""
-        from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerError
-
         config = CircuitBreakerConfig(failure_threshold=3, success_threshold=2, timeout_seconds=1.0)
         breaker = CircuitBreaker("api", config=config)
 
@@ -961,23 +990,20 @@ class TestIntegrationScenarios:
         # First 3 calls should fail but reach the API
         for _ in range(3):
             with pytest.raises(ConnectionError):
-                await breaker.execute(failing_api_call)
+                loop.run_until_complete(breaker.execute(failing_api_call))
 
         assert call_count == 3
         assert breaker.is_open
 
         # Next call should fail fast without reaching API
         with pytest.raises(CircuitBreakerError):
-            await breaker.execute(failing_api_call)
+            loop.run_until_complete(breaker.execute(failing_api_call))
 
         # Call count should not have increased
         assert call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_recovery_after_transient_failure(self):
+    def test_recovery_after_transient_failure(self):
         """Test recovery after transient failures."""
-        from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
-
         config = CircuitBreakerConfig(failure_threshold=3, success_threshold=2, timeout_seconds=0.1)
         breaker = CircuitBreaker("test", config=config)
 
@@ -21,19 +21,24 @@ from unittest.mock import MagicMock, patch
 class MockTokenCounter:
     """Mock token counter that uses word count instead of tiktoken."""
 
+    def __init__(self):
+        # Windows are recounted as they slide; remember each message's count
+        self._cache: dict[str, int] = {}
+
     def count(self, text: str) -> int:
         """Count tokens as word count for predictable testing."""
         if not text:
             return 0
-        return len(text.split())
+        cached = self._cache.get(text)
+        if cached is None:
+            cached = self._cache[text] = len(text.split())
+        return cached
 
     def count_messages(self, messages: list[dict]) -> int:
         """Count tokens in a list of messages with role overhead."""
-        total = 0
-        for msg in messages:
-            total += self.count(msg.get("content", ""))
-            total += 4  # role overhead per message
-        return total
+        count = self.count
+        # 4 tokens of role overhead per message
+        return sum(count(msg.get("content", "")) for msg in messages) + 4 * len(messages)
 
 
 # =============================================================================
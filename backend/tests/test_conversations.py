@@ -131,10 +131,7 @@ class TestConversationsSuccess:
             assert response.status_code == 200
 
             # Verify limit was called with default
-            limit_calls = [
-                c for c in mock_db_with_conversations.call_history
-                if c["method"] == "get_conversations"
-            ]
+            limit_calls = mock_db_with_conversations.calls_by_method["get_conversations"]
             assert len(limit_calls) == 1
             assert limit_calls[0]["limit"] == 50
 
@@ -294,10 +291,7 @@ class TestConversationsDatabaseInteraction:
             assert response.status_code == 200
 
             # Verify get_conversations was called
-            get_calls = [
-                c for c in mock_db_with_conversations.call_history
-                if c["method"] == "get_conversations"
-            ]
+            get_calls = mock_db_with_conversations.calls_by_method["get_conversations"]
             assert len(get_calls) == 1
             assert get_calls[0]["creator_id"] == "test-creator-123"
 
@@ -308,10 +302,7 @@ class TestConversationsDatabaseInteraction:
 
             assert response.status_code == 200
 
-            get_calls = [
-                c for c in mock_db_with_conversations.call_history
-                if c["method"] == "get_conversations"
-            ]
+            get_calls = mock_db_with_conversations.calls_by_method["get_conversations"]
             assert get_calls[0]["limit"] == 25
 
 
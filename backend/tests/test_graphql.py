@@ -502,7 +502,7 @@ class TestMutations:
             await resolver.resolve_send_message(
                 input={"message": "Test message", "creatorId": "creator-123"}
             )
-        save_calls = [c for c in mock_db.call_history if c["method"] == "save_conversation"]
+        save_calls = mock_db.calls_by_method["save_conversation"]
         assert len(save_calls) >= 1
 
 
@@ -586,7 +586,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_resolver_handles_db_error(self, resolver, mock_db):
         """Resolver should handle database errors gracefully."""
-        mock_db._raise_exception = Exception("Database connection failed")
+        mock_db.raise_exception = Exception("Database connection failed")
         with patch.object(resolver, '_db', mock_db):
             with pytest.raises(GraphQLError):
                 await resolver.resolve_conversations(user_id="creator-123")
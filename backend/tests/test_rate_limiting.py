@@ -15,8 +15,9 @@ Tests cover:
 import pytest
 import time
 import asyncio
-from unittest.mock import MagicMock, AsyncMock, patch
-from fastapi import FastAPI, Request, HTTPException
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 from starlette.testclient import TestClient as StarletteTestClient
 
@@ -69,14 +70,19 @@ def rate_limiter_instance(memory_backend):
     return RateLimiter(backend=memory_backend)
 
 
+def make_request(host: str = "127.0.0.1", path: str = "/test") -> SimpleNamespace:
+    """Build a request stand-in with only the attributes the rate limiter reads."""
+    return SimpleNamespace(
+        url=SimpleNamespace(path=path),
+        client=SimpleNamespace(host=host),
+        headers={},
+    )
+
+
 @pytest.fixture
 def mock_request():
     """Create a mock FastAPI request."""
-    request = MagicMock(spec=Request)
-    request.url.path = "/test"
-    request.client.host = "127.0.0.1"
-    request.headers = {}
-    return request
+    return make_request()
 
 
 @pytest.fixture
@@ -710,15 +716,8 @@ class TestIPBasedRateLimiting:
         """Test that different IPs have independent limits."""
         config = RateLimitConfig(requests=1, window_seconds=60)
 
-        request1 = MagicMock(spec=Request)
-        request1.url.path = "/test"
-        request1.client.host = "192.168.1.1"
-        request1.headers = {}
-
-        request2 = MagicMock(spec=Request)
-        request2.url.path = "/test"
-        request2.client.host = "192.168.1.2"
-        request2.headers = {}
+        request1 = make_request("192.168.1.1")
+        request2 = make_request("192.168.1.2")
 
         # Exhaust limit for IP1
         await rate_limiter_instance.check(request1, user_id=None, config=config)
@@ -666,6 +666,55 @@ class TestSemanticCacheSimilarityMatch:
         assert result is None
 
 
+# =============================================================================
+# SemanticCache Tests - Creator-Scoped Lookup
+# =============================================================================
+
+class TestSemanticCacheCreatorScope:
+    """Tests for SemanticCache creator-scoped lookup/store."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_returns_stored_answer_for_same_creator(self, semantic_cache):
+        """lookup should find an answer stored for the same creator."""
+        await semantic_cache.store("What is Python?", "creator-a", {"answer": "a"})
+
+        assert await semantic_cache.lookup("what is python? ", "creator-a") == {"answer": "a"}
+
+    @pytest.mark.asyncio
+    async def test_lookup_isolates_creators(self, semantic_cache, sample_embedding):
+        """Neither exact nor semantic matches should cross creators."""
+        await semantic_cache.store(
+            "What is Python?", "creator-a", {"answer": "a"}, embedding=sample_embedding
+        )
+
+        assert await semantic_cache.lookup("What is Python?", "creator-b") is None
+        assert await semantic_cache.lookup(
+            "What is Python?", "creator-b", embedding=sample_embedding
+        ) is None
+        assert await semantic_cache.get("What is Python?", embedding=sample_embedding) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_creator_drops_only_that_creators_answers(
+        self, semantic_cache, sample_embedding
+    ):
+        """invalidate_creator should hide a creator's answers from both match paths."""
+        for creator in ("creator-a", "creator-b"):
+            await semantic_cache.store(
+                "What is Python?", creator, {"answer": creator}, embedding=sample_embedding
+            )
+
+        await semantic_cache.invalidate_creator("creator-a")
+
+        assert await semantic_cache.lookup("What is Python?", "creator-a") is None
+        assert await semantic_cache.lookup(
+            "Python?", "creator-a", embedding=sample_embedding
+        ) is None
+        assert await semantic_cache.lookup("What is Python?", "creator-b") == {"answer": "creator-b"}
+
+        await semantic_cache.store("What is Python?", "creator-a", {"answer": "new"})
+        assert await semantic_cache.lookup("What is Python?", "creator-a") == {"answer": "new"}
+
+
 # =============================================================================
 # SemanticCache Tests - Cosine Similarity
 # =============================================================================
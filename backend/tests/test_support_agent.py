@@ -463,6 +463,36 @@ class TestGenerationNode:
             call = mock_llm.call_history[0]
             assert len(call["messages"]) >= 2  # At least system and human message
 
+    @pytest.mark.asyncio
+    async def test_generate_response_keeps_stable_prompt_prefix(self, mock_vector_store):
+        """System prompt and prior turns should precede the per-turn context."""
+        from langchain_core.messages import AIMessage, HumanMessage
+        history = [HumanMessage(content="Hi"), AIMessage(content="Hello!")]
+        state = {
+            "messages": history,
+            "context": ["Module content here"],
+            "query": "Question",
+            "creator_id": "creator-123",
+            "response": "",
+            "sources": [],
+            "should_escalate": False
+        }
+
+        mock_llm = MockChatOpenAI(default_response="Response")
+
+        with patch('app.agents.support_agent.ChatOpenAI', return_value=mock_llm):
+            from app.agents.support_agent import SupportAgent, SYSTEM_MESSAGE
+            agent = SupportAgent(mock_vector_store)
+            agent.llm = mock_llm
+
+            await agent.generate_response(state)
+            await agent.generate_response({**state, "context": ["Other content"]})
+
+            first, second = (call["messages"] for call in mock_llm.call_history)
+            assert first[:3] == second[:3]
+            assert [m["content"] for m in first[:3]] == [SYSTEM_MESSAGE.content, "Hi", "Hello!"]
+            assert "Module content here" in first[-1]["content"]
+
 
 # =============================================================================
 # AC-3: Escalation Node Tests - Flags low-confidence responses
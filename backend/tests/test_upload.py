@@ -226,6 +226,30 @@ class TestUploadSuccess:
             assert "chunks_created" in data
             assert data["chunks_created"] == 10
 
+    def test_upload_invalidates_cached_answers(
+        self, client, app, monkeypatch, sample_text_file, mock_ingestion_result
+    ):
+        """Upload should drop the creator's cached chat answers."""
+        from main import get_response_cache
+        cache = MagicMock()
+        cache.invalidate_creator = AsyncMock(return_value=True)
+        monkeypatch.setitem(app.dependency_overrides, get_response_cache, lambda: cache)
+        mock_ingest = AsyncMock(return_value=mock_ingestion_result)
+
+        with patch('main.ingestion_service.ingest_content', mock_ingest):
+            filename, file_obj, content_type = sample_text_file
+            response = client.post(
+                "/upload/content",
+                files={"file": (filename, file_obj, content_type)},
+                data={
+                    "creator_id": "test-creator-123",
+                    "content_type": "text"
+                }
+            )
+
+            assert response.status_code == 200
+            cache.invalidate_creator.assert_awaited_once_with("test-creator-123")
+
 
 # =============================================================================
 # Validation Tests